@@ -77,25 +77,30 @@ def main():
     """
     global _shared, _dashboard, _route_page, _archive_page
 
-    # Parse arguments — handles both --flag value and --flag=value formats
+    # Parse arguments in a single pass — handles both --flag value and
+    # --flag=value formats, applying each flag as it is seen instead of
+    # collecting into an intermediate dict and re-scanning.
     args = []
-    flags = {}   # key → value (or True for boolean flags)
+    ui_port = 8081
     argv = sys.argv[1:]
     i = 0
     while i < len(argv):
         a = argv[i]
-        if '=' in a and a.startswith('--'):
-            key, value = a.split('=', 1)
-            flags[key] = value
+        if a.startswith('--port='):
+            try:
+                ui_port = int(a[7:])
+            except ValueError:
+                print(f"Invalid port: {a[7:]!r}")
+                sys.exit(1)
+        elif a.startswith('--ble-pin='):
+            config.BLE_PIN = a[10:]
         elif a == '--ble-pin':
             if i + 1 < len(argv):
-                flags['--ble-pin'] = argv[i + 1]
+                config.BLE_PIN = argv[i + 1]
                 i += 1
-            else:
-                flags['--ble-pin'] = True
-        elif a.startswith('--'):
-            flags[a] = True
-        else:
+        elif a == '--debug-on':
+            config.DEBUG = True
+        elif not a.startswith('--'):
             args.append(a)
         i += 1
 
@@ -118,14 +123,6 @@ def main():
 
     ble_address = args[0]
 
-    # Apply flags
-    if '--debug-on' in flags:
-        config.DEBUG = True
-    if '--ble-pin' in flags and flags['--ble-pin'] is not True:
-        config.BLE_PIN = flags['--ble-pin']
-
-    ui_port = int(flags.get('--port', 8081))
-
     # Configure BLE-address-prefixed log file BEFORE any debug output
     config.configure_log_file(ble_address)
 
@@ -18,14 +18,120 @@ BLEWorker's asyncio event loop.
 
 import asyncio
 import logging
-from typing import Any, Callable, Coroutine, Optional
+import random
+from functools import lru_cache
+from typing import Any, Callable, Coroutine, Optional, Tuple
 
 from dbus_fast.aio import MessageBus
-from dbus_fast import BusType
+from dbus_fast import BusType, Message
 
 logger = logging.getLogger(__name__)
 
 
+# Upper bound (seconds) on a single D-Bus call.  BlueZ normally
+# answers in milliseconds; a wedged daemon must not stall the
+# reconnect loop.
+_DBUS_CALL_TIMEOUT: float = 5.0
+
+
+# Cached system-bus connection and Adapter1 proxy.  Connecting and
+# introspecting /org/bluez/hci0 dominates remove_bond wall time, so
+# both are set up once and reused for every call.  The lock guards
+# the first (or a re-)connect when several coroutines race.
+_bus: Optional[MessageBus] = None
+_adapter: Optional[Any] = None
+_bus_lock = asyncio.Lock()
+
+# Hand-authored introspection for the one adapter method this module
+# calls.  Passing it to get_proxy_object skips the Introspect
+# round-trip to BlueZ and the parsing of its full adapter XML.
+_ADAPTER_XML = """
+<node>
+  <interface name="org.bluez.Adapter1">
+    <method name="RemoveDevice">
+      <arg direction="in" name="device" type="o"/>
+    </method>
+  </interface>
+</node>
+"""
+
+
+async def _get_adapter() -> Any:
+    """Return the cached ``org.bluez.Adapter1`` interface.
+
+    Connects to the system bus on first use (or after
+    :func:`_reset_bus`) and builds the proxy from the static
+    ``_ADAPTER_XML`` node — no Introspect round-trip.  Subsequent
+    calls return the cached proxy without any bus traffic.
+    """
+    global _bus, _adapter
+    async with _bus_lock:
+        if _adapter is not None and _bus is not None and _bus.connected:
+            return _adapter
+        _bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+        proxy = _bus.get_proxy_object(
+            "org.bluez", "/org/bluez/hci0", _ADAPTER_XML
+        )
+        _adapter = proxy.get_interface("org.bluez.Adapter1")
+        return _adapter
+
+
+@lru_cache(maxsize=32)
+def _dev_path(device_address: str) -> Tuple[str, str]:
+    """``(clean_address, BlueZ object path)`` for a device address.
+
+    Cached — the reconnect loop recomputes this for the same address
+    on every bond removal and watch setup.
+    """
+    clean = device_address.replace("literal:", "")
+    return clean, "/org/bluez/hci0/dev_" + clean.replace(":", "_")
+
+
+# Persistent device watches: device object path → (seen_event,
+# removed_event).  Set up once per address and reused by every
+# reconnect cycle, so repeated disconnects don't re-issue AddMatch
+# round-trips.  One module-level handler on the shared bus fans
+# signals out to all watched paths — adding a second device costs a
+# dict entry, not another handler on the reader's hot path.
+_watches: dict = {}
+_handler_bus: Optional[MessageBus] = None
+
+
+def _signal_handler(msg) -> None:
+    """Fan incoming BlueZ signals out to the watched device paths."""
+    member = msg.member
+    if member == "PropertiesChanged":
+        if msg.body and msg.body[0] == "org.bluez.Device1":
+            watch = _watches.get(msg.path)
+            if watch:
+                watch[0].set()
+    elif member == "InterfacesAdded":
+        if msg.body:
+            watch = _watches.get(msg.body[0])
+            if watch:
+                watch[0].set()
+    elif member == "InterfacesRemoved":
+        if msg.body:
+            watch = _watches.get(msg.body[0])
+            if watch:
+                watch[1].set()
+
+
+def _reset_bus() -> None:
+    """Drop the cached bus connection; the next call reconnects lazily."""
+    global _bus, _adapter, _handler_bus
+    bus = _bus
+    _bus = None
+    _adapter = None
+    _handler_bus = None
+    _watches.clear()
+    if bus is not None:
+        try:
+            bus.disconnect()
+        except Exception:
+            pass
+
+
 async def remove_bond(device_address: str) -> bool:
     """Remove a BLE bond via D-Bus.
 
@@ -41,35 +147,88 @@ async def remove_bond(device_address: str) -> bool:
         True if the bond was successfully removed, False on error
         (e.g. if the device was already removed).
     """
-    # Strip 'literal:' prefix if present
-    clean_address = device_address.replace("literal:", "")
-    dev_path = "/org/bluez/hci0/dev_" + clean_address.replace(":", "_")
+    clean_address, dev_path = _dev_path(device_address)
 
-    bus = None
-    try:
-        bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
-        introspection = await bus.introspect("org.bluez", "/org/bluez/hci0")
-        proxy = bus.get_proxy_object(
-            "org.bluez", "/org/bluez/hci0", introspection
-        )
-        adapter = proxy.get_interface("org.bluez.Adapter1")
+    async def _do_remove() -> None:
+        adapter = await _get_adapter()
         await adapter.call_remove_device(dev_path)
-        logger.info(f"Bond removed for {clean_address}")
+
+    try:
+        await asyncio.wait_for(_do_remove(), _DBUS_CALL_TIMEOUT)
+        logger.info("Bond removed for %s", clean_address)
         print(f"BLE: Bond removed for {clean_address}")
         return True
     except Exception as e:
         # "Does Not Exist" is normal if device was already removed
         error_str = str(e)
         if "DoesNotExist" in error_str or "Does Not Exist" in error_str:
-            logger.debug(f"Bond already removed for {clean_address}")
+            logger.debug("Bond already removed for %s", clean_address)
             print(f"BLE: Bond was already removed for {clean_address}")
         else:
-            logger.warning(f"Bond removal failed: {e}")
+            logger.warning("Bond removal failed: %s", e)
             print(f"BLE: ⚠️  Bond removal failed: {e}")
+            # The bus itself may have failed — drop the cached
+            # connection so the next call starts fresh
+            _reset_bus()
         return False
-    finally:
-        if bus:
-            bus.disconnect()
+
+
+async def _watch_device(device_address: str):
+    """Subscribe to D-Bus signals for *device_address*.
+
+    Returns ``(seen_event, removed_event)``.  *seen_event* is set
+    whenever BlueZ reports activity for the device — a
+    ``PropertiesChanged`` on its ``Device1`` interface or an
+    ``InterfacesAdded`` re-creating its object path after a bond
+    removal.  *removed_event* is set when ``InterfacesRemoved``
+    confirms the device object is actually gone, so bond removal can
+    wait for that instead of a fixed settle sleep.  The subscription
+    is persistent: set up once per address and reused by every
+    reconnect cycle.  Returns ``None`` when the subscription cannot
+    be set up; callers fall back to plain sleeps.
+    """
+    global _handler_bus
+    dev_path = _dev_path(device_address)[1]
+
+    try:
+        await asyncio.wait_for(_get_adapter(), _DBUS_CALL_TIMEOUT)  # ensures a connected _bus
+        bus = _bus
+        if bus is None:
+            return None
+
+        cached = _watches.get(dev_path)
+        if cached is not None and _handler_bus is bus:
+            return cached
+
+        for rule in (
+            "type='signal',interface='org.freedesktop.DBus.Properties',"
+            f"member='PropertiesChanged',path='{dev_path}'",
+            "type='signal',interface='org.freedesktop.DBus.ObjectManager',"
+            "member='InterfacesAdded'",
+            "type='signal',interface='org.freedesktop.DBus.ObjectManager',"
+            "member='InterfacesRemoved'",
+        ):
+            await asyncio.wait_for(
+                bus.call(Message(
+                    destination="org.freedesktop.DBus",
+                    path="/org/freedesktop/DBus",
+                    interface="org.freedesktop.DBus",
+                    member="AddMatch",
+                    signature="s",
+                    body=[rule],
+                )),
+                _DBUS_CALL_TIMEOUT,
+            )
+        if _handler_bus is not bus:
+            bus.add_message_handler(_signal_handler)
+            _handler_bus = bus
+
+        watch = (asyncio.Event(), asyncio.Event())
+        _watches[dev_path] = watch
+        return watch
+    except Exception as e:
+        logger.debug("Device watch unavailable, falling back to sleeps: %s", e)
+        return None
 
 
 async def reconnect_loop(
@@ -77,49 +236,102 @@ async def reconnect_loop(
     device_address: str,
     max_retries: int = 5,
     base_delay: float = 5.0,
+    max_delay: float = 60.0,
+    jitter: float = 0.5,
+    connect_timeout: float = 30.0,
 ) -> Optional[Any]:
     """Reconnect loop: remove bond, wait, reconnect.
 
-    Uses linear backoff: the wait time increases with each
-    failed attempt (5s, 10s, 15s, 20s, 25s).
+    Uses capped exponential backoff with jitter: the delay doubles
+    per failed attempt (5s, 10s, 20s, ...) up to *max_delay*, and is
+    stretched by a random factor in ``[1, 1 + jitter]`` so repeated
+    failures don't keep colliding with adapter reset windows.
 
     Args:
         create_connection_func: Async function that sets up a new BLE
             connection and returns the ``MeshCore`` object.
         device_address: BLE MAC address.
         max_retries: Maximum number of attempts per disconnect.
-        base_delay: Base wait time in seconds (multiplied by
-            attempt number).
+        base_delay: First-attempt wait time in seconds.
+        max_delay: Cap on the exponential delay (before jitter).
+        jitter: Random stretch factor applied to every delay.
+        connect_timeout: Upper bound in seconds on a single
+            connection attempt — a stalled BLE stack counts as a
+            failed attempt instead of wedging the loop.
 
     Returns:
         The new ``MeshCore`` object on success, or ``None`` if
-        all attempts failed.
+        all attempts failed or the device is gone for good.
     """
+    # Signal-driven wake-up: when BlueZ reports the device again the
+    # backoff wait is cut short instead of sleeping out the full delay.
+    # The underlying subscription persists across reconnect cycles.
+    watch = await _watch_device(device_address)
+    device_event = watch[0] if watch else None
+    removed_event = watch[1] if watch else None
+
     for attempt in range(1, max_retries + 1):
-        delay = base_delay * attempt
+        raw = base_delay * (2 ** (attempt - 1))
+        delay = min(max_delay, raw) * (1.0 + random.random() * jitter)
         logger.info(
-            f"Reconnect attempt {attempt}/{max_retries} in {delay:.0f}s..."
+            "Reconnect attempt %d/%d in %.0fs...",
+            attempt, max_retries, delay,
         )
         print(
             f"BLE: 🔄 Reconnect attempt {attempt}/{max_retries} "
             f"in {delay:.0f}s..."
         )
-        await asyncio.sleep(delay)
+        if device_event is not None:
+            device_event.clear()
+            try:
+                await asyncio.wait_for(
+                    device_event.wait(), timeout=delay,
+                )
+                logger.info("Device seen on D-Bus — retrying early")
+                print("BLE: 📡 Device seen — retrying early")
+            except asyncio.TimeoutError:
+                pass
+        else:
+            await asyncio.sleep(delay)
 
-        # Step 1: Remove the stale bond
-        await remove_bond(device_address)
-        await asyncio.sleep(2)
+        # Step 1: Remove the stale bond.  Instead of a fixed settle
+        # sleep, wait for BlueZ's InterfacesRemoved to confirm the
+        # device object is gone — it usually fires within tens of ms.
+        if removed_event is not None:
+            removed_event.clear()
+        removed = await remove_bond(device_address)
+        if not removed:
+            pass  # nothing was removed — no settling needed
+        elif removed_event is not None:
+            try:
+                await asyncio.wait_for(removed_event.wait(), timeout=2.0)
+            except asyncio.TimeoutError:
+                pass
+        else:
+            await asyncio.sleep(2)
 
-        # Step 2: Try to reconnect
+        # Step 2: Try to reconnect (bounded — a stalled BLE stack
+        # must not block all later attempts)
         try:
-            connection = await create_connection_func()
-            logger.info(f"Reconnected after attempt {attempt}")
+            connection = await asyncio.wait_for(
+                create_connection_func(), timeout=connect_timeout,
+            )
+            logger.info("Reconnected after attempt %d", attempt)
             print(f"BLE: ✅ Reconnected after attempt {attempt}")
             return connection
+        except asyncio.TimeoutError:
+            logger.error(
+                "Reconnect attempt %d timed out after %.0fs",
+                attempt, connect_timeout,
+            )
+            print(
+                f"BLE: ❌ Reconnect attempt {attempt} timed out "
+                f"after {connect_timeout:.0f}s"
+            )
         except Exception as e:
-            logger.error(f"Reconnect attempt {attempt} failed: {e}")
+            logger.error("Reconnect attempt %d failed: %s", attempt, e)
             print(f"BLE: ❌ Reconnect attempt {attempt} failed: {e}")
 
-    logger.error(f"Reconnect failed after {max_retries} attempts")
+    logger.error("Reconnect failed after %d attempts", max_retries)
     print(f"BLE: ❌ Reconnect failed after {max_retries} attempts")
     return None
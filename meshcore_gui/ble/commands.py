@@ -6,12 +6,17 @@ of work.  New commands can be registered without modifying existing
 code (Open/Closed Principle).
 """
 
-import asyncio
+import time
 from typing import Dict, List, Optional
 
 from meshcore import MeshCore, EventType
 
-from meshcore_gui.config import BOT_DEVICE_NAME, DEVICE_NAME, debug_print
+from meshcore_gui import config
+from meshcore_gui.config import (
+    BOT_DEVICE_NAME,
+    DEVICE_NAME,
+    debug_print,
+)
 from meshcore_gui.core.models import Message
 from meshcore_gui.core.protocols import SharedDataWriter
 from meshcore_gui.services.cache import DeviceCache
@@ -26,6 +31,23 @@ class CommandHandler:
         cache:  DeviceCache for persistent storage.
     """
 
+    # Registered command actions — add new commands here (OCP).  Each
+    # name maps to a ``_cmd_<name>`` method; the bound-method registry
+    # is built once per instance in __init__.
+    _HANDLER_NAMES = (
+        'send_message',
+        'send_dm',
+        'send_advert',
+        'refresh',
+        'purge_unpinned',
+        'set_auto_add',
+        'set_device_name',
+        'login_room',
+        'logout_room',
+        'send_room_msg',
+        'load_room_history',
+    )
+
     def __init__(
         self,
         mc: MeshCore,
@@ -36,36 +58,31 @@ class CommandHandler:
         self._shared = shared
         self._cache = cache
 
-        # Handler registry — add new commands here (OCP)
         self._handlers: Dict[str, object] = {
-            'send_message': self._cmd_send_message,
-            'send_dm': self._cmd_send_dm,
-            'send_advert': self._cmd_send_advert,
-            'refresh': self._cmd_refresh,
-            'purge_unpinned': self._cmd_purge_unpinned,
-            'set_auto_add': self._cmd_set_auto_add,
-            'set_device_name': self._cmd_set_device_name,
-            'login_room': self._cmd_login_room,
-            'logout_room': self._cmd_logout_room,
-            'send_room_msg': self._cmd_send_room_msg,
-            'load_room_history': self._cmd_load_room_history,
+            name: getattr(self, f'_cmd_{name}')
+            for name in self._HANDLER_NAMES
         }
 
     async def process_all(self) -> None:
-        """Drain the command queue and dispatch each command."""
-        while True:
-            cmd = self._shared.get_next_command()
-            if cmd is None:
-                break
-            await self._dispatch(cmd)
-
-    async def _dispatch(self, cmd: Dict) -> None:
-        action = cmd.get('action')
-        handler = self._handlers.get(action)
-        if handler:
-            await handler(cmd)
-        else:
-            debug_print(f"Unknown command action: {action}")
+        """Drain the command queue and dispatch each command.
+
+        Fetches the whole queue in one call and dispatches with the
+        handler lookup inlined — no per-command queue poll or
+        intermediate dispatch frame.  The dict registry stays (rather
+        than a match statement) so new commands remain a one-line
+        registration.
+        """
+        cmds = self._shared.drain_commands()
+        if not cmds:
+            return
+        get_handler = self._handlers.get
+        for cmd in cmds:
+            action = cmd.get('action')
+            handler = get_handler(action)
+            if handler:
+                await handler(cmd)
+            else:
+                debug_print(f"Unknown command action: {action}")
 
     # ------------------------------------------------------------------
     # Individual command handlers
@@ -81,10 +98,11 @@ class CommandHandler:
                 self._shared.add_message(Message.outgoing(
                     text, channel,
                 ))
-            debug_print(
-                f"{'BOT' if is_bot else 'Sent'} message to "
-                f"channel {channel}: {text[:30]}"
-            )
+            if config.DEBUG:
+                debug_print(
+                    f"{'BOT' if is_bot else 'Sent'} message to "
+                    f"channel {channel}: {text[:30]}"
+                )
 
     async def _cmd_send_dm(self, cmd: Dict) -> None:
         pubkey = cmd.get('pubkey', '')
@@ -95,7 +113,8 @@ class CommandHandler:
             self._shared.add_message(Message.outgoing(
                 text, None, sender_pubkey=pubkey,
             ))
-            debug_print(f"Sent DM to {contact_name}: {text[:30]}")
+            if config.DEBUG:
+                debug_print(f"Sent DM to {contact_name}: {text[:30]}")
 
     async def _cmd_send_advert(self, cmd: Dict) -> None:
         await self._mc.commands.send_advert(flood=True)
@@ -111,10 +130,12 @@ class CommandHandler:
     async def _cmd_purge_unpinned(self, cmd: Dict) -> None:
         """Remove unpinned contacts from the MeshCore device.
 
-        Iterates the list of public keys, calls ``remove_contact``
-        for each one with a short delay between calls to avoid
-        overwhelming the BLE link.  After completion, triggers a
-        full refresh so the GUI reflects the new state.
+        Runs ``remove_contact`` for all public keys strictly one at a
+        time: the companion protocol has no request IDs, so the SDK
+        correlates replies by order — a second command in flight would
+        let the first device response resolve both futures and garble
+        the per-contact tally.  After completion, triggers a full
+        refresh so the GUI reflects the new state.
 
         If ``delete_from_history`` is True, also removes the
         contacts from the local device cache on disk.
@@ -135,44 +156,61 @@ class CommandHandler:
             return
 
         total = len(pubkeys)
-        removed = 0
-        errors = 0
 
         self._shared.set_status(
             f"🗑️ Removing {total} contacts..."
         )
         debug_print(f"Purge: starting removal of {total} contacts")
 
-        for i, pubkey in enumerate(pubkeys, 1):
+        last_status = 0.0
+
+        # Bound once — the loop body runs per contact and would
+        # otherwise re-resolve these attribute chains every iteration
+        remove_contact = self._mc.commands.remove_contact
+        set_status = self._shared.set_status
+
+        results: List[bool] = []
+        for done, pubkey in enumerate(pubkeys, start=1):
+            ok = False
             try:
-                r = await self._mc.commands.remove_contact(pubkey)
-                if r.type == EventType.ERROR:
-                    errors += 1
+                r = await remove_contact(pubkey)
+                ok = r.type != EventType.ERROR
+                if not ok and config.DEBUG:
                     debug_print(
                         f"Purge: remove_contact({pubkey[:16]}) "
                         f"returned ERROR"
                     )
-                else:
-                    removed += 1
+            except Exception as exc:
+                if config.DEBUG:
                     debug_print(
-                        f"Purge: removed {pubkey[:16]} "
-                        f"({i}/{total})"
+                        f"Purge: remove_contact({pubkey[:16]}) "
+                        f"exception: {exc}"
                     )
-            except Exception as exc:
-                errors += 1
+            results.append(ok)
+            # Progress status, coalesced to ~10 updates/s — each
+            # set_status is a cross-thread lock acquire, so don't
+            # fire one per contact on large purges
+            now = time.monotonic()
+            if done == total or now - last_status > 0.1:
+                last_status = now
+                set_status(f"🗑️ Removing... {done}/{total}")
+
+        removed = sum(results)
+        errors = total - removed
+
+        # One summary line instead of a print per contact — a large
+        # purge would otherwise emit hundreds of formatted lines
+        if config.DEBUG:
+            if errors:
+                failed_sample = [
+                    pk[:16] for pk, ok in zip(pubkeys, results) if not ok
+                ][:5]
                 debug_print(
-                    f"Purge: remove_contact({pubkey[:16]}) "
-                    f"exception: {exc}"
+                    f"Purge: done — {removed} removed, {errors} errors "
+                    f"(failed sample: {failed_sample})"
                 )
-
-            # Update status with progress
-            self._shared.set_status(
-                f"🗑️ Removing... {i}/{total}"
-            )
-
-            # Brief pause between BLE calls to avoid congestion
-            if i < total:
-                await asyncio.sleep(0.5)
+            else:
+                debug_print(f"Purge: done — {removed} removed")
 
         # Delete from local cache if requested
         if delete_from_history and self._cache:
@@ -4,10 +4,15 @@ BLE event callbacks for MeshCore GUI.
 Handles ``CHANNEL_MSG_RECV``, ``CONTACT_MSG_RECV`` and ``RX_LOG_DATA``
 events from the MeshCore library.  Extracted from ``BLEWorker`` so the
 worker only deals with connection lifecycle.
+
+These callbacks fire on every received packet, so their ``debug_print``
+calls are guarded with ``if config.DEBUG`` — the f-string arguments
+(payload key lists, reprs) are never built when debugging is off.
 """
 
 from typing import Dict, Optional
 
+from meshcore_gui import config
 from meshcore_gui.config import debug_print
 from meshcore_gui.core.models import Message, RxLogEntry
 from meshcore_gui.core.protocols import SharedDataWriter
@@ -53,8 +58,10 @@ class EventHandler:
     def _resolve_path_names(self, path_hashes: list) -> list:
         """Resolve 2-char path hashes to display names.
 
-        Performs a contact lookup for each hash *now* so the names are
-        captured at receive time and stored in the archive.
+        Delegates to the shared store's batch resolver so the whole
+        path is looked up under a single lock acquisition instead of
+        one per hop.  Names are captured at receive time and stored
+        in the archive.
 
         Args:
             path_hashes: List of 2-char hex strings.
@@ -63,19 +70,9 @@ class EventHandler:
             List of display names (same length as *path_hashes*).
             Unknown hashes become ``'0x<HH>'``.
         """
-        names = []
-        for h in path_hashes:
-            if not h or len(h) < 2:
-                names.append('-')
-                continue
-            name = self._shared.get_contact_name_by_prefix(h)
-            # get_contact_name_by_prefix returns h[:8] as fallback,
-            # normalise to '0x<HH>' for 2-char hashes.
-            if name and name != h[:8]:
-                names.append(name)
-            else:
-                names.append(f'0x{h.upper()}')
-        return names
+        if not path_hashes:
+            return []
+        return self._shared.resolve_path_names(path_hashes)
 
     # ------------------------------------------------------------------
     # RX_LOG_DATA — the single source of truth for path info
@@ -94,6 +91,7 @@ class EventHandler:
         
         # Try to decode payload to get message_hash
         message_hash = ""
+        msg: Optional[Message] = None
         payload_hex = payload.get('payload', '')
         if payload_hex:
             decoded = self._decoder.decode(payload_hex)
@@ -125,7 +123,7 @@ class EventHandler:
                     snr_msg = self._extract_snr(payload)
                     path_names = self._resolve_path_names(decoded.path_hashes)
 
-                    self._shared.add_message(Message.incoming(
+                    msg = Message.incoming(
                         decoded.sender,
                         decoded.text,
                         decoded.channel_idx,
@@ -136,33 +134,40 @@ class EventHandler:
                         path_hashes=decoded.path_hashes,
                         path_names=path_names,
                         message_hash=decoded.message_hash,
-                    ))
-
-                    debug_print(
-                        f"RX_LOG → message: hash={decoded.message_hash}, "
-                        f"sender={decoded.sender!r}, ch={decoded.channel_idx}, "
-                        f"path={decoded.path_hashes}, "
-                        f"path_names={path_names}"
                     )
 
-                    self._bot.check_and_reply(
-                        sender=decoded.sender,
-                        text=decoded.text,
-                        channel_idx=decoded.channel_idx,
-                        snr=snr_msg,
-                        path_len=decoded.path_length,
-                        path_hashes=decoded.path_hashes,
-                    )
-        
-        # Add RX log entry with message_hash (if available)
-        self._shared.add_rx_log(RxLogEntry(
+        entry = RxLogEntry(
             time=time_str,
             snr=snr,
             rssi=rssi,
             payload_type=payload_type,
             hops=hops,
             message_hash=message_hash,
-        ))
+        )
+
+        # Commit message + RX log entry together (one lock acquisition)
+        # when the packet decoded to a message; else just the log entry.
+        if msg is not None:
+            self._shared.add_message_with_rx_log(msg, entry)
+
+            if config.DEBUG:
+                debug_print(
+                    f"RX_LOG → message: hash={msg.message_hash}, "
+                    f"sender={msg.sender!r}, ch={msg.channel}, "
+                    f"path={msg.path_hashes}, "
+                    f"path_names={msg.path_names}"
+                )
+
+            self._bot.check_and_reply(
+                sender=msg.sender,
+                text=msg.text,
+                channel_idx=msg.channel,
+                snr=msg.snr,
+                path_len=msg.path_len,
+                path_hashes=msg.path_hashes,
+            )
+        else:
+            self._shared.add_rx_log(entry)
 
     # ------------------------------------------------------------------
     # CHANNEL_MSG_RECV — fallback when RX_LOG decode missed it
@@ -172,12 +177,14 @@ class EventHandler:
         """Handle channel message events."""
         payload = event.payload
 
-        debug_print(f"Channel msg payload keys: {list(payload.keys())}")
+        if config.DEBUG:
+            debug_print(f"Channel msg payload keys: {list(payload.keys())}")
 
         # Dedup via hash
         msg_hash = payload.get('message_hash', '')
         if msg_hash and self._dedup.is_hash_seen(msg_hash):
-            debug_print(f"Channel msg suppressed (hash): {msg_hash}")
+            if config.DEBUG:
+                debug_print(f"Channel msg suppressed (hash): {msg_hash}")
             return
 
         # Parse sender from "SenderName: message body" format
@@ -193,13 +200,15 @@ class EventHandler:
         # Dedup via content
         ch_idx = payload.get('channel_idx')
         if self._dedup.is_content_seen(sender, ch_idx, msg_text):
-            debug_print(f"Channel msg suppressed (content): {sender!r}")
+            if config.DEBUG:
+                debug_print(f"Channel msg suppressed (content): {sender!r}")
             return
 
-        debug_print(
-            f"Channel msg (fallback): sender={sender!r}, "
-            f"text={msg_text[:40]!r}"
-        )
+        if config.DEBUG:
+            debug_print(
+                f"Channel msg (fallback): sender={sender!r}, "
+                f"text={msg_text[:40]!r}"
+            )
 
         sender_pubkey = ''
         if sender:
@@ -252,7 +261,8 @@ class EventHandler:
         txt_type = payload.get('txt_type', 0)
         signature = payload.get('signature', '')
 
-        debug_print(f"DM payload keys: {list(payload.keys())}")
+        if config.DEBUG:
+            debug_print(f"DM payload keys: {list(payload.keys())}")
 
         # Common fields for both Room and DM messages
         msg_hash = payload.get('message_hash', '')
@@ -285,11 +295,12 @@ class EventHandler:
                 path_names=path_names,
                 message_hash=msg_hash,
             ))
-            debug_print(
-                f"Room msg from {author} (sig={signature}) "
-                f"via room {pubkey[:12]}: "
-                f"{payload.get('text', '')[:30]}"
-            )
+            if config.DEBUG:
+                debug_print(
+                    f"Room msg from {author} (sig={signature}) "
+                    f"via room {pubkey[:12]}: "
+                    f"{payload.get('text', '')[:30]}"
+                )
             return
 
         # --- Regular DM ---
@@ -310,7 +321,8 @@ class EventHandler:
             path_names=path_names,
             message_hash=msg_hash,
         ))
-        debug_print(f"DM received from {sender}: {payload.get('text', '')[:30]}")
+        if config.DEBUG:
+            debug_print(f"DM received from {sender}: {payload.get('text', '')[:30]}")
 
     # ------------------------------------------------------------------
     # Helpers
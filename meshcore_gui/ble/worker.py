@@ -28,7 +28,8 @@ v5.2 changes (BLE stability)
 - Disconnect detection in the main loop with auto-reconnect.
 - Bond cleanup before each reconnect attempt (fixes "PIN or Key
   Missing" errors from stale BlueZ bonds).
-- Linear backoff reconnect (configurable via ``RECONNECT_*`` settings).
+- Exponential backoff reconnect with jitter (configurable via
+  ``RECONNECT_*`` settings).
 
 v5.1 changes
 ~~~~~~~~~~~~~
@@ -55,6 +56,9 @@ from meshcore_gui.config import (
     CONTACT_REFRESH_SECONDS,
     MAX_CHANNELS,
     RECONNECT_BASE_DELAY,
+    RECONNECT_CONNECT_TIMEOUT,
+    RECONNECT_JITTER,
+    RECONNECT_MAX_DELAY,
     RECONNECT_MAX_RETRIES,
     debug_data,
     debug_print,
@@ -77,6 +81,11 @@ KEY_RETRY_INTERVAL: float = 30.0
 # Seconds between periodic cleanup of old archived data (24 hours).
 CLEANUP_INTERVAL: float = 86400.0
 
+# Upper bound (seconds) on the main-loop wait for new GUI commands.
+# Commands wake the loop instantly via the command event; this timeout
+# only paces the periodic housekeeping (contact refresh, key retry).
+CMD_WAIT_TIMEOUT: float = 1.0
+
 
 class BLEWorker:
     """BLE communication worker that runs in a separate thread.
@@ -114,6 +123,10 @@ class BLEWorker:
         # Dynamically discovered channels from device
         self._channels: List[Dict] = []
 
+        # Event-driven command wake-up (created on the BLE loop)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._cmd_event: Optional[asyncio.Event] = None
+
     # ------------------------------------------------------------------
     # Thread lifecycle
     # ------------------------------------------------------------------
@@ -127,7 +140,28 @@ class BLEWorker:
     def _run(self) -> None:
         asyncio.run(self._async_main())
 
+    def _notify_command(self) -> None:
+        """Wake the BLE loop when the GUI enqueues a command.
+
+        Called from the GUI thread via SharedData.put_command, so the
+        event must be set through ``call_soon_threadsafe``.
+
+        ``call_soon_threadsafe`` already wakes the loop through
+        asyncio's internal self-pipe, so a dedicated socketpair (the
+        UDP-loopback trick used by firmware bridges) would duplicate
+        that mechanism without shaving measurable latency here —
+        command dispatch is bounded by BLE round-trips, not wakeups.
+        """
+        if self._loop and self._cmd_event:
+            self._loop.call_soon_threadsafe(self._cmd_event.set)
+
     async def _async_main(self) -> None:
+        # Capture the loop and wire the command wake-up so GUI commands
+        # are dispatched immediately instead of on a 100 ms poll.
+        self._loop = asyncio.get_running_loop()
+        self._cmd_event = asyncio.Event()
+        self.shared.set_command_notifier(self._notify_command)
+
         # ── Step 1: Start PIN agent (BEFORE any BLE connection) ──
         await self._agent.start()
 
@@ -156,6 +190,7 @@ class BLEWorker:
                 last_cleanup = time.time()
 
                 while self.running and not self._disconnected:
+                    self._cmd_event.clear()
                     try:
                         await self._cmd_handler.process_all()
                     except Exception as e:
@@ -198,7 +233,14 @@ class BLEWorker:
                         await self._cleanup_old_data()
                         last_cleanup = now
 
-                    await asyncio.sleep(0.1)
+                    # Sleep until the GUI enqueues a command (instant
+                    # wake-up) or the housekeeping timeout elapses.
+                    try:
+                        await asyncio.wait_for(
+                            self._cmd_event.wait(), timeout=CMD_WAIT_TIMEOUT,
+                        )
+                    except asyncio.TimeoutError:
+                        pass
 
                 # ── Disconnect detected — reconnect ──
                 if self._disconnected and self.running:
@@ -222,6 +264,9 @@ class BLEWorker:
                         self.address,
                         max_retries=RECONNECT_MAX_RETRIES,
                         base_delay=RECONNECT_BASE_DELAY,
+                        max_delay=RECONNECT_MAX_DELAY,
+                        jitter=RECONNECT_JITTER,
+                        connect_timeout=RECONNECT_CONNECT_TIMEOUT,
                     )
 
                     if new_mc:
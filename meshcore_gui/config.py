@@ -314,10 +314,23 @@ BLE_PIN: str = "123456"
 # Maximum number of reconnect attempts after a BLE disconnect.
 RECONNECT_MAX_RETRIES: int = 5
 
-# Base delay in seconds between reconnect attempts (multiplied by
-# attempt number for linear backoff: 5s, 10s, 15s, 20s, 25s).
+# Base delay in seconds between reconnect attempts.  Doubled per
+# attempt (exponential backoff: 5s, 10s, 20s, 40s, ...) and then
+# stretched by a random jitter factor.
 RECONNECT_BASE_DELAY: float = 5.0
 
+# Cap on the exponential backoff delay, in seconds (before jitter).
+RECONNECT_MAX_DELAY: float = 60.0
+
+# Jitter factor: each delay is multiplied by a random value in
+# [1.0, 1.0 + RECONNECT_JITTER] so repeated failures don't align
+# with adapter reset windows.
+RECONNECT_JITTER: float = 0.5
+
+# Upper bound in seconds on a single reconnect attempt.  A stalled
+# BLE stack counts as a failed attempt instead of wedging the loop.
+RECONNECT_CONNECT_TIMEOUT: float = 30.0
+
 # Interval in seconds between periodic contact refreshes from the device.
 # Contacts are merged (new/changed contacts update the cache; contacts
 # only present in cache are kept so offline nodes are preserved).
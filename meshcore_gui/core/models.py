@@ -15,11 +15,17 @@ UI code can access attributes directly (``msg.sender``) or fall back
 to ``dataclasses.asdict(msg)`` if a plain dict is needed.
 """
 
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
 from typing import Dict, List, Optional
 
 
+# Per-second cache for Message.now_timestamp(): [epoch_second, "HH:MM:SS"].
+# Event bursts within the same wall-clock second reuse the formatted
+# string instead of re-running strftime per packet.
+_HMS_CACHE: list = [0, ""]
+
+
 # ---------------------------------------------------------------------------
 # Message
 # ---------------------------------------------------------------------------
@@ -57,6 +63,12 @@ class Message:
     message_hash: str = ""
     channel_name: str = ""
 
+    def __post_init__(self) -> None:
+        # Formatted-line cache: (channel name, line).  All other line
+        # components are immutable after construction, so a line only
+        # needs re-formatting when the channel name changes.
+        self._line_cache: Optional[tuple] = None
+
     @staticmethod
     def from_dict(d: dict) -> "Message":
         """Create a Message from an archive dictionary.
@@ -86,8 +98,13 @@ class Message:
 
     @staticmethod
     def now_timestamp() -> str:
-        """Current time formatted as ``HH:MM:SS``."""
-        return datetime.now().strftime('%H:%M:%S')
+        """Current time formatted as ``HH:MM:SS`` (cached per second)."""
+        t = int(time.time())
+        if t != _HMS_CACHE[0]:
+            lt = time.localtime(t)
+            _HMS_CACHE[0] = t
+            _HMS_CACHE[1] = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+        return _HMS_CACHE[1]
 
     # -- Factory methods -------------------------------------------------
 
@@ -175,8 +192,6 @@ class Message:
         Returns:
             Formatted single-line string.
         """
-        direction = '→' if self.direction == 'out' else '←'
-
         if self.channel is not None:
             if channel_names and self.channel in channel_names:
                 ch_name = channel_names[self.channel]
@@ -184,9 +199,17 @@ class Message:
                 ch_name = self.channel_name
             else:
                 ch_name = f'ch{self.channel}'
-            ch_label = f'[{ch_name}]'
         else:
-            ch_label = '[DM]'
+            ch_name = None  # DM
+
+        # Formatted once per channel name, then served from cache —
+        # cache hits do no string building at all
+        if self._line_cache is not None and self._line_cache[0] == ch_name:
+            return self._line_cache[1]
+
+        ch_label = f'[{ch_name}]' if ch_name is not None else '[DM]'
+
+        direction = '→' if self.direction == 'out' else '←'
 
         if self.direction == 'in' and self.path_len > 0:
             hop_tag = f' [{self.path_len}h{"✓" if self.path_hashes else ""}]'
@@ -194,8 +217,11 @@ class Message:
             hop_tag = ''
 
         if self.sender:
-            return f"{self.time} {direction} {ch_label}{hop_tag} {self.sender}: {self.text}"
-        return f"{self.time} {direction} {ch_label}{hop_tag} {self.text}"
+            line = f"{self.time} {direction} {ch_label}{hop_tag} {self.sender}: {self.text}"
+        else:
+            line = f"{self.time} {direction} {ch_label}{hop_tag} {self.text}"
+        self._line_cache = (ch_name, line)
+        return line
 
 
 # ---------------------------------------------------------------------------
@@ -293,15 +319,29 @@ class RxLogEntry:
     hops: int = 0
     message_hash: str = ""
 
+    def __post_init__(self) -> None:
+        # Pre-formatted table row, built once at creation so the GUI
+        # never re-formats entries it has already seen.
+        self.display_row: Dict[str, str] = {
+            'time': self.time,
+            'snr': f"{self.snr:.1f}",
+            'type': self.payload_type,
+        }
+
 
 # ---------------------------------------------------------------------------
 # RouteNode
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RouteNode:
     """A node in a message route (sender, repeater or receiver).
 
+    Slotted: routes allocate one node per hop on every build, and
+    slots cut the per-instance memory and speed up field access.
+    Frozen: nodes are shared between memoized route results, so
+    immutability is part of the contract.
+
     Attributes:
         name:   Display name (or ``'-'`` if unknown).
         lat:    Latitude (0.0 if unknown).
@@ -319,4 +359,5 @@ class RouteNode:
     @property
     def has_location(self) -> bool:
         """True if the node has GPS coordinates."""
-        return self.lat != 0 or self.lon != 0
+        # Truthiness: floats are falsy only at exactly 0
+        return bool(self.lat or self.lon)
@@ -17,7 +17,7 @@ v4.1 changes
 - ``SharedDataWriter.add_rx_log`` now accepts an ``RxLogEntry`` dataclass.
 """
 
-from typing import Dict, List, Optional, Protocol, runtime_checkable
+from typing import Callable, Dict, List, Optional, Protocol, runtime_checkable
 
 from meshcore_gui.core.models import Message, RxLogEntry
 
@@ -54,8 +54,12 @@ class SharedDataWriter(Protocol):
     def set_channels(self, channels: List[Dict]) -> None: ...
     def add_message(self, msg: Message) -> None: ...
     def add_rx_log(self, entry: RxLogEntry) -> None: ...
+    def add_message_with_rx_log(self, msg: Message, entry: RxLogEntry) -> None: ...
     def get_next_command(self) -> Optional[Dict]: ...
+    def drain_commands(self) -> List[Dict]: ...
+    def set_command_notifier(self, notify: Callable[[], None]) -> None: ...
     def get_contact_name_by_prefix(self, pubkey_prefix: str) -> str: ...
+    def resolve_path_names(self, path_hashes: list) -> list: ...
     def get_contact_by_name(self, name: str) -> Optional[tuple]: ...
     def is_bot_enabled(self) -> bool: ...
     def put_command(self, cmd: Dict) -> None: ...
@@ -76,12 +80,14 @@ class SharedDataWriter(Protocol):
 class SharedDataReader(Protocol):
     """Read-side interface used by GUI pages.
 
-    GUI pages read snapshots of the shared data and manage
-    update flags.  They also enqueue commands for the BLE worker.
+    GUI pages read snapshots of the shared data and compare the
+    per-collection version counters against the versions they last
+    rendered.  They also enqueue commands for the BLE worker.
     """
 
     def get_snapshot(self) -> Dict: ...
-    def clear_update_flags(self) -> None: ...
+    def get_route_snapshot(self) -> Dict: ...
+    def wait_for_update(self, timeout: float = 0.0) -> bool: ...
     def mark_gui_initialized(self) -> None: ...
     def put_command(self, cmd: Dict) -> None: ...
     def set_bot_enabled(self, enabled: bool) -> None: ...
@@ -102,6 +108,8 @@ class ContactLookup(Protocol):
 
     def get_contact_by_prefix(self, pubkey_prefix: str) -> Optional[Dict]: ...
     def get_contact_by_name(self, name: str) -> Optional[tuple]: ...
+    def resolve_sender(self, pubkey: str, name: str) -> Optional[tuple]: ...
+    def get_prefix_index(self) -> Dict[str, Dict]: ...
 
 
 # ----------------------------------------------------------------------
@@ -14,10 +14,10 @@ v4.1 changes
   directly (``msg.sender``) instead of dict keys (``msg['sender']``).
 """
 
-import queue
 import threading
+from collections import deque
 from dataclasses import asdict
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 from meshcore_gui.config import debug_print
 from meshcore_gui.core.models import DeviceInfo, Message, RxLogEntry
@@ -44,17 +44,67 @@ class SharedData:
         # Data collections (typed)
         self.contacts: Dict = {}
         self.channels: List[Dict] = []
-        self.messages: List[Message] = []
-        self.rx_log: List[RxLogEntry] = []
-
-        # Command queue (GUI → BLE)
-        self.cmd_queue: queue.Queue = queue.Queue()
-
-        # Update flags — initially True so first GUI render shows data
-        self.device_updated: bool = True
-        self.contacts_updated: bool = True
-        self.channels_updated: bool = True
-        self.rxlog_updated: bool = True
+        self.messages: Deque[Message] = deque(maxlen=100)
+        self.rx_log: Deque[RxLogEntry] = deque(maxlen=50)
+
+        # Command channel (GUI → BLE).  Single producer (GUI thread),
+        # single consumer (BLE thread): deque.append/popleft are atomic
+        # under the GIL, so no lock or queue.Queue condition variable
+        # is needed on this path.
+        self.cmd_queue: Deque[Dict] = deque()
+
+        # Optional wake-up callback invoked after each put_command so
+        # the BLE worker can react immediately instead of polling.
+        self._cmd_notifier: Optional[Callable[[], None]] = None
+
+        # Version counters — bumped on every mutation of the matching
+        # collection.  The GUI remembers the last version it rendered
+        # and only redraws a section when its counter moved on.
+        # Starting at 1 guarantees the first render sees "changed".
+        self.device_version: int = 1
+        self.contacts_version: int = 1
+        self.channels_version: int = 1
+        self.messages_version: int = 1
+        self.rxlog_version: int = 1
+
+        # Aggregate version — bumped by every mutation that affects the
+        # snapshot, so get_snapshot can hand out a cached dict on idle
+        # ticks instead of copying every collection twice per second.
+        self.global_version: int = 1
+
+        # Set by every mutator alongside the global_version bump, so
+        # readers can ask "anything new?" without taking the lock.
+        self._update_event = threading.Event()
+
+        self._snapshot_cache: Optional[Dict] = None
+        self._snapshot_version: int = 0
+        self._snap_contacts: Optional[Tuple[int, Dict]] = None
+        self._snap_channels: Optional[Tuple[int, List[Dict]]] = None
+        self._snap_messages: Optional[Tuple[int, List[Message]]] = None
+        self._snap_rxlog: Optional[Tuple[int, List[RxLogEntry]]] = None
+
+        # Lowercased-pubkey view for prefix lookups, rebuilt lazily
+        # when contacts change: (contacts_version, [(key_lower, key,
+        # contact), ...]).  Prefix matching then runs on pre-folded
+        # strings instead of lowercasing every pubkey per call.
+        self._contacts_lower_cache: Optional[Tuple[int, List[Tuple[str, str, Dict]]]] = None
+
+        # Pubkey-prefix index for 1-byte path-hash lookups, rebuilt
+        # lazily when contacts change: (contacts_version, {first 2 hex
+        # chars lowercased: contact}).  Shared by all route views.
+        self._prefix_index_cache: Optional[Tuple[int, Dict[str, Dict]]] = None
+
+        # First-byte buckets for arbitrary-length prefix lookups:
+        # (contacts_version, {first 2 hex chars: [(key_lower, key,
+        # contact), ...]}).  A lookup scans one bucket (~N/256 entries)
+        # instead of the whole contact list.
+        self._prefix_buckets_cache: Optional[Tuple[int, Dict[str, List[Tuple[str, str, Dict]]]]] = None
+
+        # Name indexes for get_contact_by_name, rebuilt lazily when
+        # contacts change: (contacts_version, {adv_name: (key,
+        # contact)}, {adv_name_lower: (key, contact)}).  Exact and
+        # case-insensitive lookups become one dict access each.
+        self._name_index_cache: Optional[Tuple[int, Dict[str, Tuple[str, Dict]], Dict[str, Tuple[str, Dict]]]] = None
 
         # Flag to track if GUI has done first render
         self.gui_initialized: bool = False
@@ -98,7 +148,9 @@ class SharedData:
             d.tx_power = payload.get('tx_power', d.tx_power)
             d.adv_lat = payload.get('adv_lat', d.adv_lat)
             d.adv_lon = payload.get('adv_lon', d.adv_lon)
-            self.device_updated = True
+            self.device_version += 1
+            self.global_version += 1
+            self._update_event.set()
             debug_print(f"Device info updated: {d.name}")
 
     def update_from_device_query(self, payload: Dict) -> None:
@@ -107,7 +159,9 @@ class SharedData:
             self.device.firmware_version = payload.get(
                 'ver', self.device.firmware_version,
             )
-            self.device_updated = True
+            self.device_version += 1
+            self.global_version += 1
+            self._update_event.set()
             debug_print(f"Firmware version: {self.device.firmware_version}")
 
     # ------------------------------------------------------------------
@@ -117,10 +171,14 @@ class SharedData:
     def set_status(self, status: str) -> None:
         with self.lock:
             self.status = status
+            self.global_version += 1
+            self._update_event.set()
 
     def set_connected(self, connected: bool) -> None:
         with self.lock:
             self.connected = connected
+            self.global_version += 1
+            self._update_event.set()
 
     # ------------------------------------------------------------------
     # BOT
@@ -129,6 +187,8 @@ class SharedData:
     def set_bot_enabled(self, enabled: bool) -> None:
         with self.lock:
             self.bot_enabled = enabled
+            self.global_version += 1
+            self._update_event.set()
             debug_print(f"BOT {'enabled' if enabled else 'disabled'}")
 
     def is_bot_enabled(self) -> bool:
@@ -143,6 +203,8 @@ class SharedData:
         """Set auto-add contacts flag (thread-safe)."""
         with self.lock:
             self.auto_add_enabled = enabled
+            self.global_version += 1
+            self._update_event.set()
             debug_print(f"Auto-add {'enabled' if enabled else 'disabled'}")
 
     def is_auto_add_enabled(self) -> bool:
@@ -206,6 +268,8 @@ class SharedData:
                 'state': state,
                 'detail': detail,
             }
+            self.global_version += 1
+            self._update_event.set()
             debug_print(
                 f"Room login state: {pubkey_prefix[:12]}… → {state}"
                 f"{(' (' + detail + ')') if detail else ''}"
@@ -240,6 +304,8 @@ class SharedData:
         with self.lock:
             messages = [Message.from_dict(d) for d in archived]
             self._room_msg_cache[norm] = messages
+            self.global_version += 1
+            self._update_event.set()
             debug_print(
                 f"Room history loaded: {norm}… → {len(messages)} messages"
             )
@@ -261,33 +327,84 @@ class SharedData:
     # Command queue
     # ------------------------------------------------------------------
 
+    def set_command_notifier(self, notify: Callable[[], None]) -> None:
+        """Register a callback fired after each enqueued command.
+
+        The BLE worker registers a thread-safe wake-up here so command
+        dispatch is event-driven (no fixed polling interval).  The
+        callback must be safe to invoke from the GUI thread.
+        """
+        self._cmd_notifier = notify
+
     def put_command(self, cmd: Dict) -> None:
-        self.cmd_queue.put(cmd)
+        self.cmd_queue.append(cmd)
+        if self._cmd_notifier:
+            self._cmd_notifier()
 
     def get_next_command(self) -> Optional[Dict]:
         try:
-            return self.cmd_queue.get_nowait()
-        except queue.Empty:
+            return self.cmd_queue.popleft()
+        except IndexError:
             return None
 
+    def drain_commands(self) -> List[Dict]:
+        """Pop and return all queued commands, oldest first.
+
+        One call per BLE-loop wakeup instead of one cross-thread
+        popleft per command.
+        """
+        cmds: List[Dict] = []
+        pop = self.cmd_queue.popleft
+        try:
+            while True:
+                cmds.append(pop())
+        except IndexError:
+            pass
+        return cmds
+
     # ------------------------------------------------------------------
     # Collections
     # ------------------------------------------------------------------
 
     def set_contacts(self, contacts_dict: Dict) -> None:
+        """Replace the contacts store with *contacts_dict*.
+
+        Ownership handoff: the dict is stored directly, not copied.
+        Callers must hand over a dict they will not mutate afterwards
+        (the BLE worker builds a fresh dict per sync, so this saves an
+        O(N) copy on every contact refresh).
+        """
         with self.lock:
-            self.contacts = contacts_dict.copy()
-            self.contacts_updated = True
+            self.contacts = contacts_dict
+            # Pre-decode stored routes once per contact refresh so
+            # route builds iterate raw bytes instead of re-running
+            # bytes.fromhex per render
+            for contact in self.contacts.values():
+                out_path = contact.get('out_path', '')
+                if out_path and 'out_path_bytes' not in contact:
+                    try:
+                        contact['out_path_bytes'] = bytes.fromhex(
+                            out_path[:len(out_path) & ~1]
+                        )
+                    except ValueError:
+                        pass  # malformed hex — decoded lazily instead
+            self.contacts_version += 1
+            self.global_version += 1
+            self._update_event.set()
             debug_print(f"Contacts updated: {len(self.contacts)} contacts")
 
     def set_channels(self, channels: List[Dict]) -> None:
+        """Replace the channel list (same handoff contract as
+        :meth:`set_contacts` — callers must not mutate afterwards)."""
         with self.lock:
-            self.channels = channels.copy()
-            self.channels_updated = True
+            self.channels = channels
+            self.channels_version += 1
+            self.global_version += 1
+            self._update_event.set()
             debug_print(f"Channels updated: {[c['name'] for c in channels]}")
 
     def add_message(self, msg: Message) -> None:
-        """Add a Message to the store (max 100).
+        """Add a Message to the store (bounded deque, max 100).
 
         Also resolves channel_name and path_names from the current
         contacts/channels list if not already set, and appends to the
@@ -295,30 +412,35 @@ class SharedData:
         archive and cache in sync.
         """
         with self.lock:
-            # Resolve channel_name if missing
-            if not msg.channel_name and msg.channel is not None:
-                msg.channel_name = self._resolve_channel_name(msg.channel)
-
-            # Resolve path_names if missing but path_hashes are present
-            if msg.path_hashes and not msg.path_names:
-                msg.path_names = self._resolve_path_names(msg.path_hashes)
-
-            self.messages.append(msg)
-            if len(self.messages) > 100:
-                self.messages.pop(0)
-            debug_print(
-                f"Message added: {msg.sender}: {msg.text[:30]}"
-            )
-
-            # Keep room message cache in sync
-            if msg.sender_pubkey:
-                norm = msg.sender_pubkey[:12]
-                if norm in self._room_msg_cache:
-                    self._room_msg_cache[norm].append(msg)
-            
-            # Archive message for persistent storage
-            if self.archive:
-                self.archive.add_message(msg)
+            self._add_message_locked(msg)
+
+    def _add_message_locked(self, msg: Message) -> None:
+        """Append a Message. MUST be called with self.lock held."""
+        # Resolve channel_name if missing
+        if not msg.channel_name and msg.channel is not None:
+            msg.channel_name = self._resolve_channel_name(msg.channel)
+
+        # Resolve path_names if missing but path_hashes are present
+        if msg.path_hashes and not msg.path_names:
+            msg.path_names = self._resolve_path_names(msg.path_hashes)
+
+        self.messages.append(msg)
+        self.messages_version += 1
+        self.global_version += 1
+        self._update_event.set()
+        debug_print(
+            f"Message added: {msg.sender}: {msg.text[:30]}"
+        )
+
+        # Keep room message cache in sync
+        if msg.sender_pubkey:
+            norm = msg.sender_pubkey[:12]
+            if norm in self._room_msg_cache:
+                self._room_msg_cache[norm].append(msg)
+
+        # Archive message for persistent storage
+        if self.archive:
+            self.archive.add_message(msg)
 
     def _resolve_channel_name(self, channel_idx: int) -> str:
         """Resolve a channel index to its display name.
@@ -337,6 +459,21 @@ class SharedData:
                 return ch.get('name', f'Ch {channel_idx}')
         return f'Ch {channel_idx}'
 
+    def resolve_path_names(self, path_hashes: list) -> list:
+        """Resolve a list of 2-char path hashes to display names.
+
+        Public batch variant for the BLE event handlers: acquires the
+        lock once for the whole path instead of once per hop.
+
+        Args:
+            path_hashes: List of 2-char hex strings.
+
+        Returns:
+            List of display names (same length as *path_hashes*).
+        """
+        with self.lock:
+            return self._resolve_path_names(path_hashes)
+
     def _resolve_path_names(self, path_hashes: list) -> list:
         """Resolve 2-char path hashes to display names.
 
@@ -356,25 +493,46 @@ class SharedData:
             if not h or len(h) < 2:
                 names.append('-')
                 continue
+            h_lower = h.lower()
             found_name = ''
-            for key, contact in self.contacts.items():
-                if key.lower().startswith(h.lower()):
+            for key_lower, _key, contact in self._prefix_candidates(h_lower):
+                if key_lower.startswith(h_lower):
                     found_name = contact.get('adv_name', '')
                     break
             names.append(found_name if found_name else f'0x{h.upper()}')
         return names
 
     def add_rx_log(self, entry: RxLogEntry) -> None:
-        """Add an RxLogEntry (max 50, newest first)."""
+        """Add an RxLogEntry (max 50, newest first).
+
+        The bounded deque drops the oldest entry automatically once
+        the cap is reached — no copy or pop bookkeeping needed.
+        """
         with self.lock:
-            self.rx_log.insert(0, entry)
-            if len(self.rx_log) > 50:
-                self.rx_log.pop()
-            self.rxlog_updated = True
-            
-            # Archive entry for persistent storage
-            if self.archive:
-                self.archive.add_rx_log(entry)
+            self._add_rx_log_locked(entry)
+
+    def _add_rx_log_locked(self, entry: RxLogEntry) -> None:
+        """Prepend an RxLogEntry. MUST be called with self.lock held."""
+        self.rx_log.appendleft(entry)
+        self.rxlog_version += 1
+        self.global_version += 1
+        self._update_event.set()
+
+        # Archive entry for persistent storage
+        if self.archive:
+            self.archive.add_rx_log(entry)
+
+    def add_message_with_rx_log(self, msg: Message, entry: RxLogEntry) -> None:
+        """Commit a decoded packet's Message and RxLogEntry together.
+
+        A decoded RX_LOG packet produces both records; committing them
+        under one lock acquisition means the GUI snapshot never sees
+        the message without its log entry, and halves the lock
+        round-trips on the per-packet path.
+        """
+        with self.lock:
+            self._add_message_locked(msg)
+            self._add_rx_log_locked(entry)
 
     def load_recent_from_archive(self, limit: int = 100) -> int:
         """Load the most recent archived messages into the in-memory list.
@@ -400,14 +558,14 @@ class SharedData:
             return 0
 
         with self.lock:
-            # recent is newest-first; reverse so oldest is appended first
+            # recent is newest-first; reverse so oldest is appended
+            # first — the deque maxlen caps at 100 (same as add_message)
             for msg_dict in reversed(recent):
                 msg = Message.from_dict(msg_dict)
                 self.messages.append(msg)
-
-            # Cap at 100 (same as add_message)
-            if len(self.messages) > 100:
-                self.messages = self.messages[-100:]
+            self.messages_version += 1
+            self.global_version += 1
+            self._update_event.set()
 
             debug_print(
                 f"Loaded {len(recent)} recent messages from archive"
@@ -415,19 +573,92 @@ class SharedData:
             return len(recent)
 
     # ------------------------------------------------------------------
-    # Snapshot and flags
+    # Snapshot and versions
     # ------------------------------------------------------------------
 
+    def wait_for_update(self, timeout: float = 0.0) -> bool:
+        """Wait until a writer has changed shared state.
+
+        Consumes the signal: returns True exactly once per batch of
+        writes since the last call.  The dashboard timer calls this
+        with ``timeout=0`` as a lock-free "anything new?" poll —
+        blocking inside a NiceGUI timer callback would stall the event
+        loop, so the refresh cadence comes from the timer interval.
+        Threaded consumers may pass a real timeout to sleep until the
+        next write instead of polling.
+        """
+        if self._update_event.wait(timeout):
+            self._update_event.clear()
+            return True
+        return False
+
+    def get_route_snapshot(self) -> Dict:
+        """Snapshot specialized for the route page.
+
+        RoutePage reads only the message list, channels, the device
+        name/position, the archive handle and three version counters —
+        contact lookups go through the prefix index instead of the
+        snapshot.  Skipping the contacts/rx_log/room copies makes
+        opening a route page cheaper than pulling a full snapshot.
+        """
+        with self.lock:
+            if self._snap_messages is None or self._snap_messages[0] != self.messages_version:
+                self._snap_messages = (self.messages_version, list(self.messages))
+            if self._snap_channels is None or self._snap_channels[0] != self.channels_version:
+                self._snap_channels = (self.channels_version, self.channels.copy())
+
+            d = self.device
+            return {
+                'name': d.name,
+                'adv_lat': d.adv_lat,
+                'adv_lon': d.adv_lon,
+                'messages': self._snap_messages[1],
+                'channels': self._snap_channels[1],
+                'archive': self.archive,
+                'device_version': self.device_version,
+                'contacts_version': self.contacts_version,
+                'channels_version': self.channels_version,
+            }
+
     def get_snapshot(self) -> Dict:
         """Create a complete snapshot of all data for the GUI.
 
         Returns a plain dict with typed objects inside.  The
         ``messages`` and ``rx_log`` values are lists of dataclass
         instances (not dicts).
+
+        Snapshots are cached by ``global_version``: when nothing
+        changed since the previous call, the same dict is returned
+        without any copying.  On rebuild, section copies (contacts,
+        channels, messages, rx_log) are reused for sections whose
+        version counter did not move.  Callers must treat the
+        snapshot as read-only.
+
+        The snapshot deliberately stays a plain dict rather than a
+        slotted struct type: with the version cache the dict is built
+        only when state actually changed, so the per-tick cost is a
+        cache check, and dict access keeps the NiceGUI pages free of
+        a hard dependency on a serialization library.
         """
         with self.lock:
+            if (
+                self._snapshot_cache is not None
+                and self._snapshot_version == self.global_version
+            ):
+                return self._snapshot_cache
+
+            # Reuse section copies whose version is unchanged
+            if self._snap_contacts is None or self._snap_contacts[0] != self.contacts_version:
+                self._snap_contacts = (self.contacts_version, self.contacts.copy())
+            if self._snap_channels is None or self._snap_channels[0] != self.channels_version:
+                self._snap_channels = (self.channels_version, self.channels.copy())
+            if self._snap_messages is None or self._snap_messages[0] != self.messages_version:
+                self._snap_messages = (self.messages_version, list(self.messages))
+            if self._snap_rxlog is None or self._snap_rxlog[0] != self.rxlog_version:
+                self._snap_rxlog = (self.rxlog_version, list(self.rx_log))
+
             d = self.device
-            return {
+            snapshot = {
                 # DeviceInfo fields (flat for backward compat)
                 'name': d.name,
                 'public_key': d.public_key,
@@ -441,16 +672,17 @@ class SharedData:
                 # Status
                 'connected': self.connected,
                 'status': self.status,
-                # Collections (typed copies)
-                'contacts': self.contacts.copy(),
-                'channels': self.channels.copy(),
-                'messages': self.messages.copy(),
-                'rx_log': self.rx_log.copy(),
-                # Flags
-                'device_updated': self.device_updated,
-                'contacts_updated': self.contacts_updated,
-                'channels_updated': self.channels_updated,
-                'rxlog_updated': self.rxlog_updated,
+                # Collections (typed copies, reused when unchanged)
+                'contacts': self._snap_contacts[1],
+                'channels': self._snap_channels[1],
+                'messages': self._snap_messages[1],
+                'rx_log': self._snap_rxlog[1],
+                # Version counters
+                'device_version': self.device_version,
+                'contacts_version': self.contacts_version,
+                'channels_version': self.channels_version,
+                'messages_version': self.messages_version,
+                'rxlog_version': self.rxlog_version,
                 'gui_initialized': self.gui_initialized,
                 'bot_enabled': self.bot_enabled,
                 'auto_add_enabled': self.auto_add_enabled,
@@ -467,63 +699,193 @@ class SharedData:
                     for k, v in self._room_msg_cache.items()
                 },
             }
-
-    def clear_update_flags(self) -> None:
-        with self.lock:
-            self.device_updated = False
-            self.contacts_updated = False
-            self.channels_updated = False
-            self.rxlog_updated = False
+            self._snapshot_cache = snapshot
+            self._snapshot_version = self.global_version
+            return snapshot
 
     def mark_gui_initialized(self) -> None:
         with self.lock:
             self.gui_initialized = True
+            self.global_version += 1
+            self._update_event.set()
             debug_print("GUI marked as initialized")
 
     # ------------------------------------------------------------------
     # Contact lookups
     # ------------------------------------------------------------------
 
+    def _contacts_lower(self) -> List[Tuple[str, str, Dict]]:
+        """Lowercased-pubkey contact list for prefix matching.
+
+        MUST be called with self.lock held.  Rebuilt lazily when
+        ``contacts_version`` moves on; each pubkey is case-folded once
+        per contacts change instead of once per lookup.
+        """
+        cache = self._contacts_lower_cache
+        if cache is not None and cache[0] == self.contacts_version:
+            return cache[1]
+        view = [
+            (key.lower(), key, contact)
+            for key, contact in self.contacts.items()
+        ]
+        self._contacts_lower_cache = (self.contacts_version, view)
+        return view
+
+    def get_prefix_index(self) -> Dict[str, Dict]:
+        """Contacts indexed by the first 2 hex chars of their pubkey.
+
+        Rebuilt lazily when ``contacts_version`` moves on, so all
+        concurrent route views share one index instead of each
+        building their own.  On a prefix collision the first contact
+        in iteration order wins.  Callers must treat the returned
+        dict as read-only.
+        """
+        with self.lock:
+            cache = self._prefix_index_cache
+            if cache is not None and cache[0] == self.contacts_version:
+                return cache[1]
+            index: Dict[str, Dict] = {}
+            for pubkey, contact in self.contacts.items():
+                prefix = pubkey[:2].lower()
+                if prefix not in index:
+                    index[prefix] = contact
+            self._prefix_index_cache = (self.contacts_version, index)
+            return index
+
+    def _prefix_candidates(self, prefix: str) -> List[Tuple[str, str, Dict]]:
+        """Contacts that can match *prefix* (already lowercased).
+
+        MUST be called with self.lock held.  For prefixes of 2+ hex
+        chars only the matching first-byte bucket is returned; shorter
+        prefixes fall back to the full lowercased view.
+        """
+        if len(prefix) < 2:
+            return self._contacts_lower()
+
+        cache = self._prefix_buckets_cache
+        if cache is None or cache[0] != self.contacts_version:
+            buckets: Dict[str, List[Tuple[str, str, Dict]]] = {}
+            for entry in self._contacts_lower():
+                buckets.setdefault(entry[0][:2], []).append(entry)
+            cache = (self.contacts_version, buckets)
+            self._prefix_buckets_cache = cache
+        return cache[1].get(prefix[:2], [])
+
+    def _contact_by_prefix_locked(self, prefix: str) -> Optional[Dict]:
+        """Prefix lookup body.  MUST be called with self.lock held;
+        *prefix* must already be lowercased.  Returns the live contact
+        dict (no copy)."""
+        # Fast path: most messages carry the full pubkey, which is an
+        # exact key in the contacts dict — one O(1) lookup, no scan
+        contact = self.contacts.get(prefix)
+        if contact is not None:
+            return contact
+        candidates = self._prefix_candidates(prefix)
+        # Common case: stored key is a full pubkey, one startswith
+        # per candidate settles it
+        for key_lower, _key, contact in candidates:
+            if key_lower.startswith(prefix):
+                return contact
+        # Rare fallback: stored key is shorter than the queried
+        # prefix (truncated pubkey) — only then reverse the test
+        plen = len(prefix)
+        for key_lower, _key, contact in candidates:
+            if len(key_lower) < plen and prefix.startswith(key_lower):
+                return contact
+        return None
+
     def get_contact_by_prefix(self, pubkey_prefix: str) -> Optional[Dict]:
         if not pubkey_prefix:
             return None
         with self.lock:
-            for key, contact in self.contacts.items():
-                if key.lower().startswith(pubkey_prefix.lower()) or pubkey_prefix.lower().startswith(key.lower()):
-                    return contact.copy()
-        return None
+            contact = self._contact_by_prefix_locked(pubkey_prefix.lower())
+            return contact.copy() if contact else None
 
     def get_contact_name_by_prefix(self, pubkey_prefix: str) -> str:
         if not pubkey_prefix:
             return ""
+        prefix = pubkey_prefix.lower()
         with self.lock:
-            for key, contact in self.contacts.items():
-                if key.lower().startswith(pubkey_prefix.lower()):
+            for key_lower, _key, contact in self._prefix_candidates(prefix):
+                if key_lower.startswith(prefix):
                     name = contact.get('adv_name', '')
                     if name:
                         return name
         return pubkey_prefix[:8]
 
+    def _name_indexes(self) -> Tuple[Dict[str, Tuple[str, Dict]], Dict[str, Tuple[str, Dict]]]:
+        """``(exact, lowercased)`` name → (key, contact) indexes.
+
+        MUST be called with self.lock held.  Rebuilt lazily when
+        ``contacts_version`` moves on; on duplicate names the first
+        contact in iteration order wins, matching the old scan.
+        """
+        cache = self._name_index_cache
+        if cache is not None and cache[0] == self.contacts_version:
+            return cache[1], cache[2]
+        exact: Dict[str, Tuple[str, Dict]] = {}
+        lower: Dict[str, Tuple[str, Dict]] = {}
+        for key, contact in self.contacts.items():
+            adv = contact.get('adv_name', '')
+            if not adv:
+                continue
+            exact.setdefault(adv, (key, contact))
+            lower.setdefault(adv.lower(), (key, contact))
+        self._name_index_cache = (self.contacts_version, exact, lower)
+        return exact, lower
+
+    def _contact_by_name_locked(self, name: str) -> Optional[Tuple[str, Dict]]:
+        """Name lookup body.  MUST be called with self.lock held.
+        Returns ``(key, live contact dict)`` — no copy."""
+        exact, lower = self._name_indexes()
+        # Strategy 1: exact match
+        hit = exact.get(name)
+        # Strategy 2: case-insensitive
+        if hit is None:
+            hit = lower.get(name.lower())
+        if hit is not None:
+            return hit
+        # Strategy 3: prefix match — rare fallback, keeps the scan
+        for key, contact in self.contacts.items():
+            adv = contact.get('adv_name', '')
+            if not adv:
+                continue
+            if name.startswith(adv) or adv.startswith(name):
+                return (key, contact)
+        return None
+
     def get_contact_by_name(self, name: str) -> Optional[Tuple[str, Dict]]:
         if not name:
             return None
         with self.lock:
-            # Strategy 1: exact match
-            for key, contact in self.contacts.items():
-                if contact.get('adv_name', '') == name:
-                    return (key, contact.copy())
-            # Strategy 2: case-insensitive
-            name_lower = name.lower()
-            for key, contact in self.contacts.items():
-                if contact.get('adv_name', '').lower() == name_lower:
-                    return (key, contact.copy())
-            # Strategy 3: prefix match
-            for key, contact in self.contacts.items():
-                adv = contact.get('adv_name', '')
-                if not adv:
-                    continue
-                if name.startswith(adv) or adv.startswith(name):
-                    return (key, contact.copy())
+            hit = self._contact_by_name_locked(name)
+            return (hit[0], hit[1].copy()) if hit else None
+
+    def resolve_sender(self, pubkey: str, name: str) -> Optional[Tuple[str, Dict]]:
+        """Resolve a message sender by pubkey prefix, then by name.
+
+        Batches both live lookups under a single lock hold so route
+        building acquires the lock once instead of twice when the
+        prefix misses.  The name fallback only runs after a prefix
+        miss, mirroring the two separate lookups it replaces.
+
+        Args:
+            pubkey: Sender pubkey (full or prefix hex string, may be '').
+            name:   Sender display name (may be '').
+
+        Returns:
+            ``(pubkey, contact copy)`` — the queried pubkey for a
+            prefix hit, the stored key for a name hit — or None.
+        """
+        with self.lock:
+            if pubkey:
+                contact = self._contact_by_prefix_locked(pubkey.lower())
+                if contact is not None:
+                    return (pubkey, contact.copy())
+            if name:
+                hit = self._contact_by_name_locked(name)
+                if hit is not None:
+                    return (hit[0], hit[1].copy())
         return None
 
     # ------------------------------------------------------------------
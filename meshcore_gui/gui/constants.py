@@ -2,10 +2,17 @@
 Display constants for the GUI layer.
 
 Contact type → icon/name/label mappings used by multiple panels.
+
+The ``*_SEQ`` tuples are index-by-type variants for per-contact loops:
+types are contiguous 0..3, so ``TYPE_ICONS_SEQ[ctype]`` (with a bounds
+check) avoids the dict hash + ``.get`` call per contact per update.
 """
 
-from typing import Dict
+from typing import Dict, Tuple
 
 TYPE_ICONS: Dict[int, str] = {0: "○", 1: "📱", 2: "📡", 3: "🏠"}
 TYPE_NAMES: Dict[int, str] = {0: "-", 1: "CLI", 2: "REP", 3: "ROOM"}
 TYPE_LABELS: Dict[int, str] = {0: "-", 1: "Companion", 2: "Repeater", 3: "Room Server"}
+
+TYPE_ICONS_SEQ: Tuple[str, ...] = tuple(TYPE_ICONS[i] for i in range(4))
+TYPE_NAMES_SEQ: Tuple[str, ...] = tuple(TYPE_NAMES[i] for i in range(4))
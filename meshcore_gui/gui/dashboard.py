@@ -7,6 +7,9 @@ All visual content is delegated to individual panel classes in
 """
 
 import logging
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 from nicegui import ui
 
@@ -34,6 +37,17 @@ class _DeletedClientFilter(logging.Filter):
 
 logging.getLogger('nicegui').addFilter(_DeletedClientFilter())
 
+# Single worker that formats and prints unexpected _update_ui
+# exceptions.  Traceback rendering and console IO are blocking; during
+# an exception storm doing them inline would stall the NiceGUI event
+# loop and with it every connected client.
+_LOG_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gui-log')
+
+
+def _report_update_error(exc: Exception) -> None:
+    print(f"GUI update error: {exc}\n"
+          + ''.join(traceback.format_exception(exc)), end='')
+
 
 class DashboardPage:
     """Main dashboard rendered at ``/``.
@@ -62,6 +76,37 @@ class DashboardPage:
         # Local first-render flag
         self._initialized: bool = False
 
+        # Last-rendered version per collection — a section is only
+        # redrawn when its counter in the snapshot moved on.
+        self._seen_versions: dict[str, int] = {}
+
+        # Last snapshot object rendered.  get_snapshot() returns the
+        # identical dict while nothing changed, so an identity check
+        # turns an idle tick into a no-op.
+        self._last_snapshot: dict | None = None
+
+        # Last status text pushed to the header label — skips the
+        # element assignment (and its websocket diff) when unchanged.
+        self._last_status: str = ''
+
+        # Timestamp of the last refresh per always-updated panel.
+        # These panels have no own version counter covering every
+        # input, so they fall back to a 1 s timebox when nothing they
+        # track explicitly has changed.
+        self._last_panel_ts: dict[str, float] = {}
+
+        # Room-server pubkey set passed to the messages panel on the
+        # last rebuild — part of the panel's input signature (a new
+        # room changes which DMs the panel hides).
+        self._last_room_pubkeys: set[str] | None = None
+
+        # True while a snapshot change has not yet reached the room
+        # server panel.  Room login states carry no version counter,
+        # so when the 1 s timebox skips their render the update signal
+        # is already consumed — this flag keeps later ticks running
+        # until the deferred render happens.
+        self._rooms_update_owed: bool = False
+
     # ------------------------------------------------------------------
     # Public
     # ------------------------------------------------------------------
@@ -69,6 +114,12 @@ class DashboardPage:
     def render(self) -> None:
         """Build the complete dashboard layout and start the timer."""
         self._initialized = False
+        self._seen_versions = {}
+        self._last_snapshot = None
+        self._last_status = ''
+        self._last_panel_ts = {}
+        self._last_room_pubkeys = None
+        self._rooms_update_owed = False
 
         # Create panel instances
         put_cmd = self._shared.put_command
@@ -106,8 +157,25 @@ class DashboardPage:
                 self._actions.render()
                 self._rxlog.render()
 
-        # Start update timer
-        ui.timer(0.5, self._update_ui)
+        # Update timer.  Runs at 100 ms for sub-500 ms event-to-screen
+        # latency; the snapshot identity check in _update_ui makes
+        # idle ticks a no-op, so the faster cadence costs nothing
+        # while the mesh is quiet.
+        timer = ui.timer(0.1, self._update_ui)
+
+        # Pause the timer entirely while the browser tab is hidden —
+        # a backgrounded dashboard then does zero polling work.  The
+        # Page Visibility state is forwarded as a custom event; any
+        # update that arrives while hidden keeps the writer's update
+        # signal set, so the first tick after reactivation redraws.
+        ui.on(
+            'visibility_hidden',
+            lambda e: timer.deactivate() if e.args else timer.activate(),
+        )
+        ui.add_body_html(
+            '<script>document.addEventListener("visibilitychange",'
+            ' () => emitEvent("visibility_hidden", document.hidden));</script>'
+        )
 
     # ------------------------------------------------------------------
     # Room Server callback (from ContactsPanel)
@@ -131,65 +199,139 @@ class DashboardPage:
             if not self._status_label:
                 return
 
-            data = self._shared.get_snapshot()
             is_first = not self._initialized
 
+            # Idle tick: no writer signalled since the last pull and
+            # no panel-side change pending (filter toggle, room
+            # added/removed) — skip even the snapshot pull
+            # (wait_for_update(0) is a lock-free poll).
+            if (
+                not is_first
+                and not self._shared.wait_for_update(0)
+                and not self._messages.needs_refresh
+                and not self._room_server.needs_refresh
+                and not self._rooms_update_owed
+            ):
+                return
+
+            data = self._shared.get_snapshot()
+
+            # Backstop: the signal fired but nothing visible changed
+            # (e.g. another page consumed the same state).
+            if (
+                not is_first
+                and data is self._last_snapshot
+                and not self._messages.needs_refresh
+                and not self._room_server.needs_refresh
+                and not self._rooms_update_owed
+            ):
+                return
+            snapshot_changed = data is not self._last_snapshot
+            self._last_snapshot = data
+
             # Mark initialised immediately — even if a panel update
             # crashes below, we must NOT retry the full first-render
             # path every 500 ms (that causes the infinite rebuild).
             if is_first:
                 self._initialized = True
 
-            # Always update status
-            self._status_label.text = data['status']
+            # Status label — only reassign when the text changed
+            if data['status'] != self._last_status:
+                self._status_label.text = data['status']
+                self._last_status = data['status']
+
+            # Compare version counters against the last rendered state
+            seen = self._seen_versions
+            device_changed = data['device_version'] != seen.get('device')
+            channels_changed = data['channels_version'] != seen.get('channels')
+            contacts_changed = data['contacts_version'] != seen.get('contacts')
+            messages_changed = data['messages_version'] != seen.get('messages')
+            rxlog_changed = data['rxlog_version'] != seen.get('rxlog')
 
             # Device info
-            if data['device_updated'] or is_first:
+            if device_changed:
                 self._device.update(data)
-                  # to show own position if changed
-                self._map.update(data)
+                # to show own position if changed
+                self._map.update(data, device_changed=True)
 
             # Channels → filter checkboxes + channel dropdown + BOT state
-            if data['channels_updated'] or is_first:
+            if channels_changed:
                 self._messages.update_filters(data)
                 self._messages.update_channel_options(data['channels'])
                 self._actions.update(data)
 
             # Contacts
-            if data['contacts_updated'] or is_first:
+            if contacts_changed:
                 self._contacts.update(data)
 
             # Map
             if data['contacts'] and (
-                data['contacts_updated'] or not self._map.has_markers or is_first
+                contacts_changed or not self._map.has_markers
             ):
-                self._map.update(data)
-
-            # Messages (always — for live filter changes)
-            self._messages.update(
-                data,
-                self._messages.channel_filters,
-                self._messages.last_channels,
-                room_pubkeys=self._room_server.get_room_pubkeys() if self._room_server else None,
+                self._map.update(data, contacts_changed=True)
+
+            # Messages — rebuilt only when one of its actual inputs
+            # changed: new messages, channel rename, contact-name
+            # resolution, a pending filter toggle, or the set of room
+            # servers (whose messages are filtered out of this panel).
+            now = time.monotonic()
+            ts = self._last_panel_ts
+            room_pubkeys = (
+                self._room_server.get_room_pubkeys() if self._room_server else None
             )
-
-            # Room Server panels (always — for live messages + contact changes)
-            self._room_server.update(data)
+            if (
+                messages_changed
+                or channels_changed
+                or contacts_changed
+                or self._messages.needs_refresh
+                or room_pubkeys != self._last_room_pubkeys
+            ):
+                self._messages.update(
+                    data,
+                    self._messages.channel_filters,
+                    self._messages.last_channels,
+                    room_pubkeys=room_pubkeys,
+                )
+                self._last_room_pubkeys = room_pubkeys
+
+            # Room Server panels — same pattern (live messages,
+            # contact changes, a room added/removed in the GUI,
+            # 1 s timebox for the rest).  Any new snapshot may carry a
+            # room login-state change that has no version counter of
+            # its own, so a render stays owed until one actually runs
+            # — a timebox skip here must not drop it for good.
+            if snapshot_changed:
+                self._rooms_update_owed = True
+            if (
+                messages_changed
+                or contacts_changed
+                or self._room_server.needs_refresh
+                or now - ts.get('rooms', 0.0) >= 1.0
+            ):
+                self._room_server.update(data)
+                ts['rooms'] = now
+                self._rooms_update_owed = False
 
             # RX Log
-            if data['rxlog_updated']:
+            if rxlog_changed:
                 self._rxlog.update(data)
 
-            # Clear flags
-            self._shared.clear_update_flags()
+            # Remember what was rendered for the next tick
+            seen['device'] = data['device_version']
+            seen['channels'] = data['channels_version']
+            seen['contacts'] = data['contacts_version']
+            seen['messages'] = data['messages_version']
+            seen['rxlog'] = data['rxlog_version']
 
             # Signal BLE worker that GUI is ready for data
             if is_first and data['channels'] and data['contacts']:
                 self._shared.mark_gui_initialized()
 
+        except RuntimeError as e:
+            # NiceGUI raises RuntimeError when the browser tab was
+            # closed or refreshed while the timer was mid-update; the
+            # stale client is benign and the next tick recovers.
+            if config.DEBUG:
+                config.debug_print(f"GUI update skipped (stale client): {e}")
         except Exception as e:
-            err = str(e).lower()
-            if "deleted" not in err and "client" not in err:
-                import traceback
-                print(f"GUI update error: {e}")
-                traceback.print_exc()
+            _LOG_EXECUTOR.submit(_report_update_error, e)
@@ -1,10 +1,11 @@
 """Contacts panel — list of known mesh nodes with click-to-DM."""
 
+from functools import partial
 from typing import Callable, Dict, Optional
 
 from nicegui import ui
 
-from meshcore_gui.gui.constants import TYPE_ICONS, TYPE_NAMES
+from meshcore_gui.gui.constants import TYPE_ICONS_SEQ, TYPE_NAMES_SEQ
 from meshcore_gui.services.contact_cleaner import ContactCleanerService
 from meshcore_gui.services.pin_store import PinStore
 
@@ -33,6 +34,12 @@ class ContactsPanel:
         self._auto_add_checkbox = None
         self._last_data: Optional[Dict] = None
 
+        # Keyed row cache: pubkey → {'row': ui.row, 'fingerprint': tuple}.
+        # Lets update() skip untouched rows instead of rebuilding the
+        # whole list on every contacts change.
+        self._contact_rows: Dict[str, Dict] = {}
+        self._row_order: list = []
+
     def render(self) -> None:
         with ui.card().classes('w-full'):
             ui.label('👥 Contacts').classes('font-bold text-gray-600')
@@ -62,72 +69,117 @@ class ContactsPanel:
             if self._auto_add_checkbox.value != device_state:
                 self._auto_add_checkbox.set_value(device_state)
 
-        self._container.clear()
+        # Bind hot lookups to locals — the sort key and fingerprint
+        # loop below run once per contact per update
+        is_pinned = self._pin_store.is_pinned
 
         # Sort: pinned contacts first, then alphabetical within each group
         contacts_items = list(data['contacts'].items())
         contacts_items.sort(
             key=lambda item: (
-                0 if self._pin_store.is_pinned(item[0]) else 1,
-                item[1].get('adv_name', item[0][:12]).lower(),
+                0 if is_pinned(item[0]) else 1,
+                (item[1].get('adv_name') or item[0][:12]).lower(),
             )
         )
 
-        with self._container:
-            for key, contact in contacts_items:
-                ctype = contact.get('type', 0)
-                icon = TYPE_ICONS.get(ctype, '○')
-                name = contact.get('adv_name', key[:12])
-                type_name = TYPE_NAMES.get(ctype, '-')
-                lat = contact.get('adv_lat', 0)
-                lon = contact.get('adv_lon', 0)
-                has_loc = lat != 0 or lon != 0
-                pinned = self._pin_store.is_pinned(key)
-
-                tooltip = (
-                    f"{name}\nType: {type_name}\n"
-                    f"Key: {key[:16]}...\nClick to send DM"
-                )
-                if has_loc:
-                    tooltip += f"\nLat: {lat:.4f}\nLon: {lon:.4f}"
+        new_order = [key for key, _ in contacts_items]
+
+        if new_order != self._row_order:
+            # Order changed (add/remove/rename/pin) — full rebuild.
+            self._container.clear()
+            self._contact_rows = {}
+            self._row_order = new_order
+            with self._container:
+                for key, contact in contacts_items:
+                    self._contact_rows[key] = {
+                        'row': self._build_contact_row(key, contact),
+                        'fingerprint': self._fingerprint(key, contact),
+                    }
+            return
 
-                row_classes = (
-                    'w-full items-center gap-1 py-0 px-1 '
-                    'rounded no-wrap '
-                )
-                if pinned:
-                    row_classes += 'bg-yellow-50'
-                
-                # Outer row: checkbox + clickable contact info
-                with ui.row().classes(row_classes):
-                    # Pin checkbox — click.stop prevents DM dialog opening
-                    cb = ui.checkbox(
-                        value=pinned,
-                    ).props('dense size=xs').on(
-                        'click.stop', lambda e: None,
-                    )
-                    cb.on_value_change(
-                        lambda e, k=key: self._toggle_pin(k)
-                    )
+        # Same order — diff per row and only touch changed contacts
+        fingerprint_of = self._fingerprint
+        contact_rows = self._contact_rows
+        for index, (key, contact) in enumerate(contacts_items):
+            cached = contact_rows[key]
+            fingerprint = fingerprint_of(key, contact)
+            if fingerprint == cached['fingerprint']:
+                continue
+            cached['row'].delete()
+            with self._container:
+                row = self._build_contact_row(key, contact)
+            row.move(target_index=index)
+            contact_rows[key] = {
+                'row': row,
+                'fingerprint': fingerprint,
+            }
+
+    def _fingerprint(self, key: str, contact: Dict) -> tuple:
+        """Displayed content of a contact row, for change detection."""
+        return (
+            contact.get('type', 0),
+            contact.get('adv_name') or key[:12],
+            contact.get('adv_lat', 0),
+            contact.get('adv_lon', 0),
+            self._pin_store.is_pinned(key),
+        )
+
+    def _build_contact_row(self, key: str, contact: Dict):
+        """Create a single contact row inside the current container."""
+        ctype = contact.get('type', 0)
+        in_range = 0 <= ctype < len(TYPE_ICONS_SEQ)
+        icon = TYPE_ICONS_SEQ[ctype] if in_range else '○'
+        name = contact.get('adv_name') or key[:12]
+        type_name = TYPE_NAMES_SEQ[ctype] if in_range else '-'
+        lat = contact.get('adv_lat', 0)
+        lon = contact.get('adv_lon', 0)
+        has_loc = bool(lat or lon)
+        pinned = self._pin_store.is_pinned(key)
+
+        tooltip = (
+            f"{name}\nType: {type_name}\n"
+            f"Key: {key[:16]}...\nClick to send DM"
+        )
+        if has_loc:
+            tooltip += f"\nLat: {lat:.4f}\nLon: {lon:.4f}"
 
-                    # Clickable area for DM
-                    with ui.row().classes(
-                        'items-center gap-0.5 flex-grow '
-                        'cursor-pointer hover:bg-gray-100 rounded py-0 px-1'
-                    ).on(
-                        'click',
-                        lambda e, k=key, n=name, t=ctype: self._on_contact_click(k, n, t),
-                    ):
-                        ui.label(icon).classes('text-sm')
-                        ui.label(name[:15]).classes(
-                            'text-sm flex-grow truncate'
-                        ).tooltip(tooltip)
-                        ui.label(type_name).classes('text-xs text-gray-500')
-                        loc_icon = '📍' if has_loc else '✖'
-                        loc_cls = 'text-xs w-4 text-center'
-                        if not has_loc:
-                            loc_cls += ' text-red-400'
-                        ui.label(loc_icon).classes(loc_cls)
+        row_classes = (
+            'w-full items-center gap-1 py-0 px-1 '
+            'rounded no-wrap '
+        )
+        if pinned:
+            row_classes += 'bg-yellow-50'
+
+        # Outer row: checkbox + clickable contact info
+        row = ui.row().classes(row_classes)
+        with row:
+            # Pin checkbox — click.stop prevents DM dialog opening
+            cb = ui.checkbox(
+                value=pinned,
+            ).props('dense size=xs').on(
+                'click.stop', lambda e: None,
+            )
+            cb.on_value_change(partial(self._toggle_pin, key))
+
+            # Clickable area for DM
+            with ui.row().classes(
+                'items-center gap-0.5 flex-grow '
+                'cursor-pointer hover:bg-gray-100 rounded py-0 px-1'
+            ).on(
+                'click',
+                partial(self._on_contact_click, key, name, ctype),
+            ):
+                ui.label(icon).classes('text-sm')
+                ui.label(name[:15]).classes(
+                    'text-sm flex-grow truncate'
+                ).tooltip(tooltip)
+                ui.label(type_name).classes('text-xs text-gray-500')
+                loc_icon = '📍' if has_loc else '✖'
+                loc_cls = 'text-xs w-4 text-center'
+                if not has_loc:
+                    loc_cls += ' text-red-400'
+                ui.label(loc_icon).classes(loc_cls)
+        return row
 
     # ------------------------------------------------------------------
     # Pin toggle
@@ -1,11 +1,11 @@
 """Map panel — Leaflet map with own position and contact markers."""
 
-from typing import Dict, List
+from typing import Dict
 
 from nicegui import ui
 
 from meshcore_gui.config import DEFAULT_MAP_CENTER, DEFAULT_MAP_ZOOM
-from meshcore_gui.gui.constants import TYPE_ICONS
+from meshcore_gui.gui.constants import TYPE_ICONS_SEQ
 
 
 class MapPanel:
@@ -13,12 +13,15 @@ class MapPanel:
 
     def __init__(self) -> None:
         self._map = None
-        self._contacts_markers: List = []
+        # pubkey → (marker, lat, lon) so updates only touch markers
+        # that were added, removed or moved since the last tick
+        self._marker_by_key: Dict[str, tuple] = {}
         self._own_marker = None
+        self._own_pos: tuple = ()
 
     @property
     def has_markers(self) -> bool:
-        return bool(self._contacts_markers)
+        return bool(self._marker_by_key)
 
     def render(self) -> None:
         with ui.card().classes('w-full'):
@@ -26,34 +29,61 @@ class MapPanel:
                 center=DEFAULT_MAP_CENTER, zoom=DEFAULT_MAP_ZOOM
             ).classes('w-full h-72')
 
-    def update(self, data: Dict) -> None:
+    def update(
+        self,
+        data: Dict,
+        device_changed: bool = False,
+        contacts_changed: bool = False,
+    ) -> None:
         if not self._map:
             return
 
-        # Own position
-        if (data['device_updated'] or self._own_marker is None) and (data['adv_lat'] and data['adv_lon']):
-            try:
-                self._map.remove_layer(self._own_marker)
-            except Exception:
-                pass
-
-            self._own_marker = self._map.marker(latlng=(data['adv_lat'], data['adv_lon']), options={'title': '📡 ' + data['name']})
-            self._map.set_center((data['adv_lat'], data['adv_lon']))
-
-        # Contact markers
-        if data['contacts_updated'] or not self.has_markers:
-            # Remove old markers
-            for marker in self._contacts_markers:
+        # Own position — only touch the marker when it actually moved
+        if (device_changed or self._own_marker is None) and (data['adv_lat'] and data['adv_lon']):
+            own_pos = (data['adv_lat'], data['adv_lon'])
+            if own_pos != self._own_pos or self._own_marker is None:
                 try:
-                    self._map.remove_layer(marker)
+                    self._map.remove_layer(self._own_marker)
                 except Exception:
                     pass
-            self._contacts_markers.clear()
 
+                self._own_marker = self._map.marker(latlng=own_pos, options={'title': '📡 ' + data['name']})
+                self._own_pos = own_pos
+                self._map.set_center(own_pos)
+
+        # Contact markers — diff against the previous set instead of
+        # remove-all/re-add (zero leaflet traffic when nothing moved)
+        if contacts_changed or not self.has_markers:
+            seen_keys = set()
             for key, contact in data['contacts'].items():
                 lat = contact.get('adv_lat', 0)
                 lon = contact.get('adv_lon', 0)
-                if lat != 0 or lon != 0:
-                    icon = TYPE_ICONS.get(contact.get('type', 0), '○')
-                    marker = self._map.marker(latlng=(lat, lon), options={'title': icon + ' ' + contact.get('adv_name', key[:16])})
-                    self._contacts_markers.append(marker)
+                if not (lat or lon):
+                    continue
+                seen_keys.add(key)
+
+                cached = self._marker_by_key.get(key)
+                if cached and cached[1] == lat and cached[2] == lon:
+                    continue
+                if cached:
+                    try:
+                        self._map.remove_layer(cached[0])
+                    except Exception:
+                        pass
+
+                ctype = contact.get('type', 0)
+                icon = (
+                    TYPE_ICONS_SEQ[ctype]
+                    if 0 <= ctype < len(TYPE_ICONS_SEQ) else '○'
+                )
+                marker = self._map.marker(latlng=(lat, lon), options={'title': icon + ' ' + (contact.get('adv_name') or key[:16])})
+                self._marker_by_key[key] = (marker, lat, lon)
+
+            # Remove markers for contacts that vanished or lost coords
+            for key in list(self._marker_by_key):
+                if key not in seen_keys:
+                    try:
+                        self._map.remove_layer(self._marker_by_key[key][0])
+                    except Exception:
+                        pass
+                    del self._marker_by_key[key]
@@ -1,5 +1,6 @@
 """Messages panel — filtered message display with inline filters and message input."""
 
+from functools import partial
 from typing import Callable, Dict, List, Set
 
 from nicegui import ui
@@ -24,10 +25,19 @@ class MessagesPanel:
         self._filter_container = None
         self._channel_filters: Dict = {}
         self._last_channels: List[Dict] = []
+        self._channel_names: Dict[int, str] = {}
+        self._last_select_channels: List[Dict] = []
         self._msg_input = None
         self._channel_select = None
         self._last_fingerprint = None  # skip rebuild when unchanged
 
+        # Checkbox state folded into ints so the per-message filter
+        # loop does one bit test instead of two dict lookups + an
+        # attribute read.  Recomputed on toggle and on channel change.
+        self._disabled_ch_mask: int = 0
+        self._dm_disabled: bool = False
+        self._filters_dirty: bool = False
+
     # -- Properties (same as FilterPanel originals) --------------------
 
     @property
@@ -80,22 +90,59 @@ class MessagesPanel:
         self._filter_container.clear()
         self._channel_filters = {}
 
+        on_toggle = lambda e: self._recompute_filter_mask()
+
         with self._filter_container:
-            cb_dm = ui.checkbox('DM', value=True)
+            cb_dm = ui.checkbox('DM', value=True, on_change=on_toggle)
             self._channel_filters['DM'] = cb_dm
 
             for ch in data['channels']:
-                cb = ui.checkbox(f"[{ch['idx']}] {ch['name']}", value=True)
+                cb = ui.checkbox(
+                    f"[{ch['idx']}] {ch['name']}", value=True,
+                    on_change=on_toggle,
+                )
                 self._channel_filters[ch['idx']] = cb
 
         self._last_channels = data['channels']
+        # Rebuilt only here (channels changed) instead of per tick
+        self._channel_names = {
+            ch['idx']: ch['name'] for ch in data['channels']
+        }
+        self._recompute_filter_mask()
+
+    def _recompute_filter_mask(self) -> None:
+        """Fold the filter checkboxes into a disabled-channel bitmask."""
+        mask = 0
+        for idx, cb in self._channel_filters.items():
+            if isinstance(idx, int) and not cb.value:
+                mask |= 1 << idx
+        self._disabled_ch_mask = mask
+        dm_cb = self._channel_filters.get('DM')
+        self._dm_disabled = dm_cb is not None and not dm_cb.value
+        self._filters_dirty = True
+
+    @property
+    def needs_refresh(self) -> bool:
+        """True when a filter toggled since the last update() call.
+
+        Lets the dashboard's early-out tick gate know a re-render is
+        needed even though the data snapshot itself did not change.
+        """
+        return self._filters_dirty
 
     # -- Channel selector (moved from InputPanel) ----------------------
 
     def update_channel_options(self, channels: List[Dict]) -> None:
-        """Update the channel dropdown options."""
+        """Update the channel dropdown options.
+
+        The options dict is derived from the device's channel list, so
+        it is rebuilt only when that list actually changed.
+        """
         if not self._channel_select or not channels:
             return
+        if channels == self._last_select_channels:
+            return
+        self._last_select_channels = channels
         opts = {ch['idx']: f"[{ch['idx']}] {ch['name']}" for ch in channels}
         self._channel_select.options = opts
         if self._channel_select.value not in opts:
@@ -153,22 +200,25 @@ class MessagesPanel:
         if not self._container:
             return
 
+        self._filters_dirty = False
         room_pks = room_pubkeys or set()
-        channel_names = {ch['idx']: ch['name'] for ch in last_channels}
+        channel_names = self._channel_names
         messages: List[Message] = data['messages']
 
-        # Apply filters
+        # Apply filters — one bit test per message; channels without a
+        # checkbox have no bit set and stay visible, as before
+        dm_disabled = self._dm_disabled
+        disabled_mask = self._disabled_ch_mask
         filtered = []
         for orig_idx, msg in enumerate(messages):
             # Skip room server messages (shown in RoomServerPanel)
             if self._is_room_message(msg, room_pks):
                 continue
             if msg.channel is None:
-                if channel_filters.get('DM') and not channel_filters['DM'].value:
-                    continue
-            else:
-                if msg.channel in channel_filters and not channel_filters[msg.channel].value:
+                if dm_disabled:
                     continue
+            elif (disabled_mask >> msg.channel) & 1:
+                continue
             filtered.append((orig_idx, msg))
 
         # Rebuild only when content changed
@@ -186,6 +236,6 @@ class MessagesPanel:
                 ui.label(line).classes(
                     'text-xs leading-tight cursor-pointer '
                     'hover:bg-blue-50 rounded px-1'
-                ).on('click', lambda e, i=orig_idx: ui.navigate.to(
-                    f'/route/{i}', new_tab=True
+                ).on('click', partial(
+                    ui.navigate.to, f'/route/{orig_idx}', new_tab=True,
                 ))
@@ -1,5 +1,6 @@
 """Room Server panel — per-room messaging with login and password storage."""
 
+from functools import partial
 from typing import Callable, Dict, List, Set
 
 from nicegui import ui
@@ -38,6 +39,12 @@ class RoomServerPanel:
         # Login state tracked locally (not persisted)
         self._logged_in: Set[str] = set()
 
+        # Set when a room was added or removed since the last update()
+        # call.  These are GUI-side changes that write nothing to
+        # SharedData, so without this flag the dashboard's event-gated
+        # tick would never notice them on a quiet mesh.
+        self._rooms_dirty: bool = False
+
     # ------------------------------------------------------------------
     # Render — restore persisted rooms on startup
     # ------------------------------------------------------------------
@@ -68,6 +75,7 @@ class RoomServerPanel:
         """
         # Persist
         self._store.add_room(pubkey, name, password)
+        self._rooms_dirty = True
 
         if pubkey in self._room_cards:
             # Already visible — update password field and re-login
@@ -95,6 +103,16 @@ class RoomServerPanel:
         """
         return set(self._room_cards.keys())
 
+    @property
+    def needs_refresh(self) -> bool:
+        """True when a room was added or removed since the last update().
+
+        Room changes originate in the GUI and feed no SharedData
+        version counter, so the dashboard's early-out tick gate checks
+        this flag to know a re-render is needed anyway.
+        """
+        return self._rooms_dirty
+
     # ------------------------------------------------------------------
     # Update (called from dashboard timer)
     # ------------------------------------------------------------------
@@ -122,6 +140,8 @@ class RoomServerPanel:
                 pubkey, card_state, room_messages, live_messages,
             )
 
+        self._rooms_dirty = False
+
     # ------------------------------------------------------------------
     # Internal — login state feedback from BLE worker
     # ------------------------------------------------------------------
@@ -218,7 +238,7 @@ class RoomServerPanel:
 
                 ui.button(
                     '✕',
-                    on_click=lambda e, pk=pubkey: self._remove_room(pk),
+                    on_click=partial(self._remove_room, pubkey),
                 ).props('flat dense round size=sm')
 
             # Password + Login row (hidden after login)
@@ -233,13 +253,13 @@ class RoomServerPanel:
 
                 card_state['login_btn'] = ui.button(
                     'Login',
-                    on_click=lambda e, pk=pubkey: self._on_login_click(pk),
+                    on_click=partial(self._on_login_click, pubkey),
                 ).classes('bg-blue-500 text-white')
 
             # Logout button (hidden before login)
             card_state['logout_btn'] = ui.button(
                 'Logout',
-                on_click=lambda e, pk=pubkey: self._on_login_click(pk),
+                on_click=partial(self._on_login_click, pubkey),
             ).classes('bg-red-500 text-white')
 
             # Set initial visibility
@@ -270,7 +290,7 @@ class RoomServerPanel:
 
                 card_state['send_btn'] = ui.button(
                     'Send',
-                    on_click=lambda e, pk=pubkey: self._send_room_message(pk),
+                    on_click=partial(self._send_room_message, pubkey),
                 ).classes('bg-blue-500 text-white')
 
             # Disable send controls if not logged in
@@ -388,6 +408,7 @@ class RoomServerPanel:
         card_state = self._room_cards.pop(pubkey, None)
         if card_state and card_state.get('card'):
             self._container.remove(card_state['card'])
+        self._rooms_dirty = True
 
     # ------------------------------------------------------------------
     # Internal — message display
@@ -29,13 +29,6 @@ class RxLogPanel:
         if not self._table:
             return
         entries: List[RxLogEntry] = data['rx_log'][:20]
-        rows = [
-            {
-                'time': e.time,
-                'snr': f"{e.snr:.1f}",
-                'type': e.payload_type,
-            }
-            for e in entries
-        ]
-        self._table.rows = rows
+        # Rows were pre-formatted at insert time (RxLogEntry.display_row)
+        self._table.rows = [e.display_row for e in entries]
         self._table.update()
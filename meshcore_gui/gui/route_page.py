@@ -11,6 +11,8 @@ v4.1 changes
   :class:`~meshcore_gui.models.RouteNode` instead of plain dicts.
 """
 
+import math
+from itertools import chain
 from typing import Dict, List, Optional
 
 from nicegui import ui
@@ -22,6 +24,19 @@ from meshcore_gui.services.route_builder import RouteBuilder
 from meshcore_gui.core.protocols import SharedDataReadAndLookup
 
 
+# Static column definitions for the route details table, hoisted so
+# they are not rebuilt on every page render.  Passed to ui.table as a
+# shallow copy since NiceGUI takes ownership of the list.
+_ROUTE_COLUMNS = (
+    {'name': 'hop', 'label': 'Hop', 'field': 'hop', 'align': 'center'},
+    {'name': 'role', 'label': 'Role', 'field': 'role'},
+    {'name': 'name', 'label': 'Name', 'field': 'name'},
+    {'name': 'hash', 'label': 'ID', 'field': 'hash', 'align': 'center'},
+    {'name': 'type', 'label': 'Type', 'field': 'type'},
+    {'name': 'location', 'label': 'Location', 'field': 'location'},
+)
+
+
 class RoutePage:
     """
     Route visualization page rendered at ``/route/{msg_index}``.
@@ -30,10 +45,23 @@ class RoutePage:
         shared: SharedDataReadAndLookup for data access and contact lookups
     """
 
+    # Maximum cached route builds before oldest are evicted.
+    _ROUTE_CACHE_MAX = 64
+
     def __init__(self, shared: SharedDataReadAndLookup) -> None:
         self._shared = shared
         self._builder = RouteBuilder(shared)
 
+        # Route-build cache: (id(msg), contacts_version, device_version)
+        # → (msg, route).  Keeping the Message in the value pins its
+        # id() for the lifetime of the entry; the version counters
+        # invalidate naturally when contacts or own position change.
+        self._route_cache: Dict[tuple, tuple] = {}
+
+        # Channel dropdown options, cached per channels_version:
+        # (version, options dict).
+        self._ch_opts_cache: Optional[tuple] = None
+
     # ------------------------------------------------------------------
     # Public
     # ------------------------------------------------------------------
@@ -46,7 +74,9 @@ class RoutePage:
         resolved from the in-memory message list; hashes are looked up
         in the persistent archive as fallback.
         """
-        data = self._shared.get_snapshot()
+        # Specialized snapshot: the route page never touches contacts,
+        # rx_log or room state, so skip those copies entirely
+        data = self._shared.get_route_snapshot()
         messages: List[Message] = data['messages']
         msg: Optional[Message] = None
 
@@ -76,7 +106,7 @@ class RoutePage:
         if msg is None:
             ui.label('❌ Message not found').classes('text-xl p-8')
             return
-        route = self._builder.build(msg, data)
+        route = self._build_cached(msg, data)
 
         ui.page_title(f'Route — {msg.sender or "Unknown"}')
         ui.dark_mode(False)
@@ -91,6 +121,29 @@ class RoutePage:
             self._render_send_panel(msg, route, data)
             self._render_route_table(msg, data, route)
 
+    # ------------------------------------------------------------------
+    # Private — route build cache
+    # ------------------------------------------------------------------
+
+    def _build_cached(self, msg: Message, data: Dict) -> Dict:
+        """Build the route for *msg*, memoized per data generation.
+
+        Reloading or revisiting a route page repeats the identical
+        build; the cache returns the previous result unless contacts
+        or the own device position changed since.
+        """
+        key = (id(msg), data['contacts_version'], data['device_version'])
+        cached = self._route_cache.get(key)
+        if cached is not None:
+            return cached[1]
+
+        route = self._builder.build(msg, data)
+        if len(self._route_cache) >= self._ROUTE_CACHE_MAX:
+            oldest = next(iter(self._route_cache))
+            del self._route_cache[oldest]
+        self._route_cache[key] = (msg, route)
+        return route
+
     # ------------------------------------------------------------------
     # Private — sub-sections
     # ------------------------------------------------------------------
@@ -107,8 +160,7 @@ class RoutePage:
     @staticmethod
     def _render_hop_summary(msg: Message, route: Dict) -> None:
         msg_path_len = route['msg_path_len']
-        path_nodes: List[RouteNode] = route['path_nodes']
-        resolved_hops = len(path_nodes)
+        resolved_hops = route['resolved_hops']
         path_source = route.get('path_source', 'none')
         expected_repeaters = max(msg_path_len - 1, 0)
 
@@ -162,59 +214,104 @@ class RoutePage:
                 ).classes('text-gray-500 italic p-4')
                 return
 
-            center_lat = data['adv_lat'] or DEFAULT_MAP_CENTER[0]
-            center_lon = data['adv_lon'] or DEFAULT_MAP_CENTER[1]
-
-            route_map = ui.leaflet(
-                center=(center_lat, center_lon), zoom=DEFAULT_MAP_ZOOM
-            ).classes('w-full h-96')
-
-            # Build ordered list of positions (or None)
-            ordered = []
-
+            # Collect located positions in route order, accumulating
+            # the centroid sums and bounding box in the same pass
             sender: RouteNode = route['sender']
-            if sender:
-                ordered.append((sender.lat, sender.lon) if sender.has_location else None)
-            else:
-                ordered.append(None)
-
-            for node in route['path_nodes']:
-                ordered.append((node.lat, node.lon) if node.has_location else None)
-
             self_node: RouteNode = route['self_node']
-            if self_node.has_location:
-                ordered.append((self_node.lat, self_node.lon))
+            sender_nodes = (sender,) if sender else ()
+
+            all_points = []
+            sum_lat = sum_lon = 0.0
+            min_lat = min_lon = 180.0
+            max_lat = max_lon = -180.0
+            for node in chain(
+                sender_nodes, route['path_nodes'], (self_node,),
+            ):
+                if node.has_location:
+                    lat, lon = node.lat, node.lon
+                    all_points.append((lat, lon))
+                    sum_lat += lat
+                    sum_lon += lon
+                    if lat < min_lat:
+                        min_lat = lat
+                    if lat > max_lat:
+                        max_lat = lat
+                    if lon < min_lon:
+                        min_lon = lon
+                    if lon > max_lon:
+                        max_lon = lon
+
+            # Center and zoom are known BEFORE the map is created, so
+            # Leaflet positions itself once instead of rendering at a
+            # default viewport and re-fetching tiles after set_center.
+            if all_points:
+                n = len(all_points)
+                center = (sum_lat / n, sum_lon / n)
+                diag = math.hypot(max_lat - min_lat, max_lon - min_lon)
+                if diag > 0:
+                    # Fit the bounding-box diagonal into the viewport
+                    zoom = max(2, min(15, int(math.log2(360 / diag))))
+                else:
+                    zoom = DEFAULT_MAP_ZOOM
             else:
-                ordered.append(None)
-
-            all_points = [p for p in ordered if p is not None]
-            for lat, lon in all_points:
-                route_map.marker(latlng=(lat, lon))
-
-            if len(all_points) >= 2:
-                route_map.generic_layer(
-                    name='polyline',
-                    args=[all_points, {'color': '#2563eb', 'weight': 3}],
+                center = (
+                    data['adv_lat'] or DEFAULT_MAP_CENTER[0],
+                    data['adv_lon'] or DEFAULT_MAP_CENTER[1],
                 )
+                zoom = DEFAULT_MAP_ZOOM
+
+            route_map = ui.leaflet(
+                center=center, zoom=zoom,
+            ).classes('w-full h-96')
 
             if all_points:
-                lats = [p[0] for p in all_points]
-                lons = [p[1] for p in all_points]
-                route_map.set_center(
-                    (sum(lats) / len(lats), sum(lons) / len(lons))
+                # One GeoJSON layer for all markers plus the route
+                # polyline — a single websocket message per render
+                # instead of one per hop.  GeoJSON order is (lon, lat).
+                features = [
+                    {
+                        'type': 'Feature',
+                        'geometry': {
+                            'type': 'Point',
+                            'coordinates': [lon, lat],
+                        },
+                        'properties': {},
+                    }
+                    for lat, lon in all_points
+                ]
+                if len(all_points) >= 2:
+                    features.append({
+                        'type': 'Feature',
+                        'geometry': {
+                            'type': 'LineString',
+                            'coordinates': [
+                                [lon, lat] for lat, lon in all_points
+                            ],
+                        },
+                        'properties': {},
+                    })
+                route_map.generic_layer(
+                    name='geoJSON',
+                    args=[
+                        {'type': 'FeatureCollection', 'features': features},
+                        {'style': {'color': '#2563eb', 'weight': 3}},
+                    ],
                 )
 
     @staticmethod
     def _render_route_table(msg: Message, data: Dict, route: Dict) -> None:
         msg_path_len = route['msg_path_len']
         path_nodes: List[RouteNode] = route['path_nodes']
-        resolved_hops = len(path_nodes)
+        resolved_hops = route['resolved_hops']
         path_source = route.get('path_source', 'none')
 
         with ui.card().classes('w-full'):
             ui.label('📋 Route Details').classes('font-bold text-gray-600')
 
             rows = []
+            # Bound as locals for the per-hop loops below
+            rows_append = rows.append
+            type_get = TYPE_LABELS.get
 
             # Sender
             sender: RouteNode = route['sender']
@@ -223,7 +320,7 @@ class RoutePage:
                     'hop': 'Start',
                     'name': sender.name,
                     'hash': sender.pubkey[:2].upper() if sender.pubkey else '-',
-                    'type': TYPE_LABELS.get(sender.type, '-'),
+                    'type': type_get(sender.type, '-'),
                     'location': f"{sender.lat:.4f}, {sender.lon:.4f}" if sender.has_location else '-',
                     'role': '📱 Sender',
                 })
@@ -239,11 +336,11 @@ class RoutePage:
 
             # Repeaters
             for i, node in enumerate(path_nodes):
-                rows.append({
+                rows_append({
                     'hop': str(i + 1),
                     'name': node.name,
                     'hash': node.pubkey[:2].upper() if node.pubkey else '-',
-                    'type': TYPE_LABELS.get(node.type, '-'),
+                    'type': type_get(node.type, '-'),
                     'location': f"{node.lat:.4f}, {node.lon:.4f}" if node.has_location else '-',
                     'role': '📡 Repeater',
                 })
@@ -251,7 +348,7 @@ class RoutePage:
             # Placeholder rows (capped at 254; 255 = firmware "unknown")
             if not path_nodes and 0 < msg_path_len < 255:
                 for i in range(msg_path_len):
-                    rows.append({
+                    rows_append({
                         'hop': str(i + 1),
                         'name': '-', 'hash': '-', 'type': '-',
                         'location': '-', 'role': '📡 Repeater',
@@ -269,14 +366,7 @@ class RoutePage:
             })
 
             ui.table(
-                columns=[
-                    {'name': 'hop', 'label': 'Hop', 'field': 'hop', 'align': 'center'},
-                    {'name': 'role', 'label': 'Role', 'field': 'role'},
-                    {'name': 'name', 'label': 'Name', 'field': 'name'},
-                    {'name': 'hash', 'label': 'ID', 'field': 'hash', 'align': 'center'},
-                    {'name': 'type', 'label': 'Type', 'field': 'type'},
-                    {'name': 'location', 'label': 'Location', 'field': 'location'},
-                ],
+                columns=list(_ROUTE_COLUMNS),
                 rows=rows,
             ).props('dense flat bordered').classes('w-full')
 
@@ -310,17 +400,25 @@ class RoutePage:
         """Send widget pre-filled with route acknowledgement message."""
         path_hashes = msg.path_hashes
 
-        parts = [f"@[{msg.sender or 'Unknown'}] Received in Zwolle path({msg.path_len})"]
-        if path_hashes:
-            path_str = '>'.join(h.upper() for h in path_hashes)
-            parts.append(f"; {path_str}")
-        prefilled = ''.join(parts)
-
-        ch_options = {
-            ch['idx']: f"[{ch['idx']}] {ch['name']}"
-            for ch in data['channels']
-        }
-        default_ch = data['channels'][0]['idx'] if data['channels'] else 0
+        prefilled = (
+            f"@[{msg.sender or 'Unknown'}] Received in Zwolle path({msg.path_len})"
+            + (
+                f"; {'>'.join(h.upper() for h in path_hashes)}"
+                if path_hashes else ''
+            )
+        )
+
+        channels = data['channels']
+        cached = self._ch_opts_cache
+        if cached is not None and cached[0] == data['channels_version']:
+            ch_options = cached[1]
+        else:
+            ch_options = {
+                ch['idx']: f"[{ch['idx']}] {ch['name']}"
+                for ch in channels
+            }
+            self._ch_opts_cache = (data['channels_version'], ch_options)
+        default_ch = channels[0]['idx'] if channels else 0
 
         with ui.card().classes('w-full'):
             ui.label('📤 Reply').classes('font-bold text-gray-600')
@@ -16,6 +16,7 @@ import time
 from dataclasses import dataclass, field
 from typing import Callable, Dict, List, Optional
 
+from meshcore_gui import config
 from meshcore_gui.config import debug_print
 
 
@@ -120,7 +121,8 @@ class MeshBot:
 
         # Guard 4: other bots?
         if sender and sender.rstrip().lower().endswith("bot"):
-            debug_print(f"BOT: skipping message from other bot '{sender}'")
+            if config.DEBUG:
+                debug_print(f"BOT: skipping message from other bot '{sender}'")
             return
 
         # Guard 5: cooldown?
@@ -152,7 +154,8 @@ class MeshBot:
             "text": reply,
             "_bot": True,
         })
-        debug_print(f"BOT: queued reply to '{sender}': {reply}")
+        if config.DEBUG:
+            debug_print(f"BOT: queued reply to '{sender}': {reply}")
 
     # ------------------------------------------------------------------
     # Extension point (OCP)
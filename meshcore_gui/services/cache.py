@@ -95,10 +95,26 @@ class DeviceCache:
         self._data["address"] = self._address
         self._data["last_updated"] = datetime.now(timezone.utc).isoformat()
 
+        # Contact dicts may be shared with SharedData, which adds the
+        # derived (non-JSON) 'out_path_bytes' field — serialize a view
+        # without it rather than persisting runtime-only data.
+        data = self._data
+        contacts = data.get("contacts")
+        if contacts and any(
+            "out_path_bytes" in c for c in contacts.values()
+        ):
+            data = dict(data)
+            data["contacts"] = {
+                key: {
+                    f: v for f, v in c.items() if f != "out_path_bytes"
+                }
+                for key, c in contacts.items()
+            }
+
         try:
             CACHE_DIR.mkdir(parents=True, exist_ok=True)
             self._path.write_text(
-                json.dumps(self._data, indent=2, ensure_ascii=False),
+                json.dumps(data, indent=2, ensure_ascii=False),
                 encoding="utf-8",
             )
             debug_print(f"Cache: saved to {self._path}")
@@ -174,23 +190,26 @@ class DeviceCache:
 
         Returns:
             The merged contacts dict (superset of cached + fresh).
+            The previously returned dict is never mutated — each merge
+            builds a new one, so callers may hand the result straight
+            to ``SharedData.set_contacts`` without copying.
         """
-        cached = self._data.get("contacts", {})
+        merged = dict(self._data.get("contacts", {}))
         now = datetime.now(timezone.utc).isoformat()
 
         for key, contact in fresh.items():
             contact_copy = contact.copy()
             contact_copy["last_seen"] = now
-            cached[key] = contact_copy
+            merged[key] = contact_copy
 
-        self._data["contacts"] = cached
+        self._data["contacts"] = merged
         self.save()
 
         debug_print(
             f"Cache: contacts merged — "
-            f"{len(fresh)} fresh, {len(cached)} total"
+            f"{len(fresh)} fresh, {len(merged)} total"
         )
-        return cached
+        return merged
 
     def remove_contacts(self, pubkeys: List[str]) -> int:
         """Remove specific contacts from the local cache by public key.
@@ -205,18 +224,22 @@ class DeviceCache:
         if not cached:
             return 0
 
+        # Build a new dict instead of deleting in place: after a
+        # merge the cached dict is the same object SharedData hands
+        # out, and that handoff contract says it is never mutated
+        # afterwards (the BLE thread holds no SharedData lock here).
+        remaining = dict(cached)
         removed = 0
         for key in pubkeys:
-            if key in cached:
-                del cached[key]
+            if remaining.pop(key, None) is not None:
                 removed += 1
 
         if removed > 0:
-            self._data["contacts"] = cached
+            self._data["contacts"] = remaining
             self.save()
             debug_print(
                 f"Cache: removed {removed} contacts from local history "
-                f"(remaining: {len(cached)})"
+                f"(remaining: {len(remaining)})"
             )
 
         return removed
@@ -9,19 +9,23 @@ displays results.
 Thread safety
 ~~~~~~~~~~~~~
 Methods read from SharedData (thread-safe) and PinStore (thread-safe).
-No mutable state is stored in this service.
+The only local state is a revision-keyed cache of the pinned set,
+refreshed atomically from the PinStore.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, Iterator, List
 
 from meshcore_gui.services.pin_store import PinStore
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PurgeStats:
     """Statistics for a planned contact purge operation.
 
+    Immutable value object — created per purge preview and only read
+    afterwards, so it is frozen and slotted.
+
     Attributes:
         unpinned_keys: Public keys of contacts that will be removed.
         pinned_count:  Number of pinned contacts that will be kept.
@@ -47,12 +51,20 @@ class ContactCleanerService:
 
     def __init__(self, pin_store: PinStore) -> None:
         self._pin_store = pin_store
+        # Pinned-set cache keyed by the store's revision counter —
+        # get_purge_stats runs on GUI refresh, so re-copying the set
+        # out of the PinStore every call is wasted work while no pin
+        # has changed.
+        self._cached_rev: int = -1
+        self._cached_pins: FrozenSet[str] = frozenset()
 
     def get_purge_stats(self, contacts: Dict) -> PurgeStats:
         """Calculate which contacts would be purged.
 
-        Iterates all contacts and separates them into pinned (kept)
-        and unpinned (to be removed).
+        Separates all contacts into pinned (kept) and unpinned (to be
+        removed) with a single set difference — ``dict.keys()`` is
+        set-like, so no Python-level loop over the contact book is
+        needed.
 
         Args:
             contacts: Contacts dict from SharedData snapshot
@@ -61,15 +73,35 @@ class ContactCleanerService:
         Returns:
             PurgeStats with the list of unpinned keys and counts.
         """
-        pinned_keys: Set[str] = self._pin_store.get_pinned()
-        unpinned_keys: List[str] = []
-
-        for pubkey in contacts:
-            if pubkey not in pinned_keys:
-                unpinned_keys.append(pubkey)
+        unpinned_keys: List[str] = list(contacts.keys() - self._pinned())
 
         return PurgeStats(
             unpinned_keys=unpinned_keys,
             pinned_count=len(contacts) - len(unpinned_keys),
             total_count=len(contacts),
         )
+
+    def iter_unpinned(self, contacts: Dict) -> Iterator[str]:
+        """Yield the public keys of unpinned contacts lazily.
+
+        For callers that stream deletions one at a time and never need
+        the counts — avoids materializing the full unpinned list for
+        large contact books.  Use :meth:`get_purge_stats` when counts
+        are needed.
+
+        Args:
+            contacts: Contacts dict from SharedData snapshot.
+
+        Yields:
+            Public keys of contacts that are not pinned.
+        """
+        pinned = self._pinned()
+        return (pubkey for pubkey in contacts if pubkey not in pinned)
+
+    def _pinned(self) -> FrozenSet[str]:
+        """Return the cached pinned set, refreshed when the store moved on."""
+        rev = self._pin_store.revision
+        if rev != self._cached_rev:
+            self._cached_pins = frozenset(self._pin_store.get_pinned())
+            self._cached_rev = rev
+        return self._cached_pins
@@ -32,6 +32,10 @@ class PinStore:
 
     def __init__(self, ble_address: str) -> None:
         self._lock = threading.Lock()
+        # Monotonic change counter — bumped on every pin/unpin so
+        # consumers can cache the pinned set and only re-read it when
+        # the revision moved on.
+        self._revision: int = 0
 
         safe_name = (
             ble_address
@@ -48,6 +52,12 @@ class PinStore:
     # Public API
     # ------------------------------------------------------------------
 
+    @property
+    def revision(self) -> int:
+        """Monotonic counter incremented on every pin/unpin."""
+        with self._lock:
+            return self._revision
+
     def is_pinned(self, pubkey: str) -> bool:
         """Check if a contact is pinned.
 
@@ -68,6 +78,7 @@ class PinStore:
         """
         with self._lock:
             self._pinned.add(pubkey)
+            self._revision += 1
             self._save()
             debug_print(f"PinStore: pinned {pubkey[:16]}")
 
@@ -79,6 +90,7 @@ class PinStore:
         """
         with self._lock:
             self._pinned.discard(pubkey)
+            self._revision += 1
             self._save()
             debug_print(f"PinStore: unpinned {pubkey[:16]}")
 
@@ -12,12 +12,35 @@ v4.1 changes
 - Route nodes returned as :class:`~meshcore_gui.models.RouteNode`.
 """
 
-from typing import Dict, List, Optional
+import sys
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 
+from meshcore_gui import config
 from meshcore_gui.config import debug_print
 from meshcore_gui.core.models import Message, RouteNode
 from meshcore_gui.core.protocols import ContactLookup
 
+# The 256 possible 1-byte hop hashes as interned hex strings.  Every
+# parsed out_path byte maps to one of these singletons, so index
+# lookups and the per-call hop memo compare by pointer instead of
+# re-hashing fresh 2-char strings per hop.
+_HEX: Tuple[str, ...] = tuple(sys.intern(f'{i:02x}') for i in range(256))
+
+# All RouteNode fields read from a contact, fetched in one C-level
+# call.  Device contacts normally carry every field; the .get chain
+# only runs for the odd incomplete record.
+_contact_fields = itemgetter('adv_name', 'adv_lat', 'adv_lon', 'type')
+
+
+def _node_fields(contact: Dict) -> Tuple:
+    """``(adv_name, adv_lat, adv_lon, type)`` with defaults for gaps."""
+    try:
+        return _contact_fields(contact)
+    except KeyError:
+        g = contact.get
+        return (g('adv_name'), g('adv_lat', 0), g('adv_lon', 0), g('type', 0))
+
 
 class RouteBuilder:
     """
@@ -29,13 +52,24 @@ class RouteBuilder:
         shared: ContactLookup for resolving pubkey prefixes to contacts
     """
 
+    # Memoized results are evicted wholesale once the cache grows past
+    # this; stale entries age out anyway because the version counters
+    # in the key change whenever contacts or device info move on.
+    _MEMO_MAX = 256
+
     def __init__(self, shared: ContactLookup) -> None:
         self._shared = shared
+        self._memo: Dict[Tuple, Dict] = {}
 
     def build(self, msg: Message, data: Dict) -> Dict:
         """
         Build route data for a single message.
 
+        Results are memoized per (message identity, contacts/device
+        version), so revisiting the same route while nothing changed
+        skips the whole resolution pipeline.  Callers must treat the
+        returned dict as read-only.
+
         Args:
             msg:  Message dataclass instance.
             data: Snapshot dictionary from SharedData.get_snapshot().
@@ -47,9 +81,25 @@ class RouteBuilder:
                 path_nodes:    List[RouteNode]
                 snr:           float or None
                 msg_path_len:  int — hop count from the message itself
+                resolved_hops: int — len(path_nodes), precomputed
                 has_locations: bool — True if any node has GPS coords
                 path_source:   str — 'rx_log', 'contact_out_path' or 'none'
         """
+        memo_key = (
+            msg.sender_pubkey,
+            msg.sender,
+            tuple(msg.path_hashes or ()),
+            tuple(msg.path_names or ()),
+            msg.path_len,
+            msg.direction,
+            msg.snr,
+            data.get('contacts_version'),
+            data.get('device_version'),
+        )
+        cached = self._memo.get(memo_key)
+        if cached is not None:
+            return cached
+
         result: Dict = {
             'sender': None,
             'self_node': RouteNode(
@@ -64,49 +114,28 @@ class RouteBuilder:
             'path_source': 'none',
         }
 
-        # Look up sender in contacts
+        # Look up sender in contacts — prefix lookup with name
+        # fallback, both under a single lock acquisition
         pubkey = msg.sender_pubkey
         contact: Optional[Dict] = None
 
-        debug_print(
-            f"Route build: sender_pubkey={pubkey!r} "
-            f"(len={len(pubkey)}, first2={pubkey[:2]!r})"
-        )
+        match = self._shared.resolve_sender(pubkey, msg.sender)
+        if match:
+            found_pubkey, contact = match
+            name, lat, lon, ctype = _node_fields(contact)
+            result['sender'] = RouteNode(
+                name=name or found_pubkey[:8],
+                lat=lat,
+                lon=lon,
+                type=ctype,
+                pubkey=found_pubkey,
+            )
 
-        if pubkey:
-            contact = self._shared.get_contact_by_prefix(pubkey)
+        if config.DEBUG:
             debug_print(
-                f"Route build: contact lookup "
-                f"{'FOUND ' + contact.get('adv_name', '?') if contact else 'NOT FOUND'}"
+                f"Route build: sender_pubkey={pubkey!r} sender={msg.sender!r} "
+                f"→ {'FOUND ' + contact.get('adv_name', '?') if contact else 'NOT FOUND'}"
             )
-            if contact:
-                result['sender'] = RouteNode(
-                    name=contact.get('adv_name') or pubkey[:8],
-                    lat=contact.get('adv_lat', 0),
-                    lon=contact.get('adv_lon', 0),
-                    type=contact.get('type', 0),
-                    pubkey=pubkey,
-                )
-
-        # Always try name-based fallback if sender still unresolved
-        if result['sender'] is None:
-            sender_name = msg.sender
-            if sender_name:
-                match = self._shared.get_contact_by_name(sender_name)
-                if match:
-                    found_pubkey, contact_data = match
-                    contact = contact_data
-                    result['sender'] = RouteNode(
-                        name=contact_data.get('adv_name') or found_pubkey[:8],
-                        lat=contact_data.get('adv_lat', 0),
-                        lon=contact_data.get('adv_lon', 0),
-                        type=contact_data.get('type', 0),
-                        pubkey=found_pubkey,
-                    )
-                    debug_print(
-                        f"Route build: name fallback "
-                        f"'{sender_name}' → pubkey={found_pubkey[:16]!r}"
-                    )
 
         # --- Resolve path nodes (priority order) ---
 
@@ -115,118 +144,162 @@ class RouteBuilder:
 
         if rx_hashes:
             result['path_nodes'] = self._resolve_hashes(
-                rx_hashes, data['contacts'], msg.path_names,
+                rx_hashes, msg.path_names,
             )
             result['path_source'] = 'rx_log'
 
-            debug_print(
-                f"Route from RX_LOG: {len(rx_hashes)} hashes → "
-                f"{len(result['path_nodes'])} nodes"
-            )
+            if config.DEBUG:
+                debug_print(
+                    f"Route from RX_LOG: {len(rx_hashes)} hashes → "
+                    f"{len(result['path_nodes'])} nodes"
+                )
 
-        # Priority 2: out_path from sender's contact record
-        elif contact:
+        # Priority 2: out_path from sender's contact record.  Skipped
+        # for incoming direct messages (msg.path_len == 0) — the
+        # message took no hops, so resolving the stored route would be
+        # wasted work and misleading.  Outgoing messages carry no hop
+        # count, so the stored route is still shown for them.
+        elif contact and (msg.path_len > 0 or msg.direction == 'out'):
             out_path = contact.get('out_path', '')
             out_path_len = contact.get('out_path_len', 0)
 
-            debug_print(
-                f"Route: sender={contact.get('adv_name')}, "
-                f"out_path={out_path!r}, out_path_len={out_path_len}, "
-                f"msg_path_len={result['msg_path_len']}"
-            )
+            if config.DEBUG:
+                debug_print(
+                    f"Route: sender={contact.get('adv_name')}, "
+                    f"out_path={out_path!r}, out_path_len={out_path_len}, "
+                    f"msg_path_len={result['msg_path_len']}"
+                )
 
             if out_path and out_path_len and out_path_len > 0:
+                # Never resolve more hops than the message traversed
+                if msg.direction != 'out':
+                    out_path_len = min(out_path_len, msg.path_len)
                 result['path_nodes'] = self._parse_out_path(
-                    out_path, out_path_len, data['contacts'],
+                    out_path, out_path_len,
+                    raw=contact.get('out_path_bytes'),
                 )
                 result['path_source'] = 'contact_out_path'
 
-        # Determine if any node has GPS coordinates
-        all_nodes: List[RouteNode] = [result['self_node']]
-        if result['sender']:
-            all_nodes.append(result['sender'])
-        all_nodes.extend(result['path_nodes'])
+        result['resolved_hops'] = len(result['path_nodes'])
 
-        result['has_locations'] = any(n.has_location for n in all_nodes)
+        # Determine if any node has GPS coordinates — a plain or-chain
+        # short-circuits on the first hit without any intermediate
+        # tuples or iterator objects
+        sender = result['sender']
+        result['has_locations'] = (
+            result['self_node'].has_location
+            or (sender is not None and sender.has_location)
+            or any(n.has_location for n in result['path_nodes'])
+        )
 
+        if len(self._memo) >= self._MEMO_MAX:
+            self._memo.clear()
+        self._memo[memo_key] = result
         return result
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
-    @staticmethod
     def _resolve_hashes(
+        self,
         hashes: List[str],
-        contacts: Dict,
         stored_names: Optional[List[str]] = None,
     ) -> List[RouteNode]:
         """Resolve a list of 1-byte path hashes into RouteNode objects.
 
         Args:
             hashes:       List of 2-char hex strings.
-            contacts:     Contact dict from snapshot.
             stored_names: Pre-resolved names from the archive (same
                           length as *hashes*).  Used as fallback when
                           the contact lookup fails (e.g. contact renamed
                           or not yet loaded).
         """
-        nodes: List[RouteNode] = []
-
-        for idx, hop_hash in enumerate(hashes):
-            if not hop_hash or len(hop_hash) < 2:
-                continue
-
-            hop_contact = RouteBuilder._find_contact_by_pubkey_hash(
-                hop_hash, contacts,
+        # Path hashes are 1 byte (2 hex chars), so hop resolution is a
+        # single lookup in the shared per-contacts-change index.  The
+        # comprehension keeps the loop on the LIST_APPEND fast path;
+        # binding the helper once skips the attribute lookup per hop.
+        index = self._shared.get_prefix_index()
+        make_node = self._make_node
+        # Routes often pass the same repeater more than once (out and
+        # back); the per-call memo hands repeated hashes the node
+        # built the first time instead of looking them up again.
+        memo: Dict[str, RouteNode] = {}
+        return [
+            make_node(idx, hop_hash, index, stored_names, memo)
+            for idx, hop_hash in enumerate(hashes)
+            if hop_hash and len(hop_hash) >= 2
+        ]
+
+    def _make_node(
+        self,
+        idx: int,
+        hop_hash: str,
+        index: Dict[str, Dict],
+        stored_names: Optional[List[str]],
+        memo: Dict[str, RouteNode],
+    ) -> RouteNode:
+        """Build one RouteNode for a path hash (enriched or placeholder)."""
+        node = memo.get(hop_hash)
+        if node is not None:
+            return node
+
+        hop_contact = index.get(hop_hash.lower())
+
+        if hop_contact:
+            name, lat, lon, ctype = _node_fields(hop_contact)
+            node = RouteNode(
+                name=name or f'0x{hop_hash}',
+                lat=lat,
+                lon=lon,
+                type=ctype,
+                pubkey=hop_hash,
             )
+            # Only resolved hops are memoized — placeholder names
+            # depend on the hop's position in the archived name list
+            memo[hop_hash] = node
+            return node
+
+        # Fallback: use the name that was stored at receive time
+        fallback_name = '-'
+        if stored_names and idx < len(stored_names):
+            fallback_name = stored_names[idx] or '-'
+        if fallback_name == '-':
+            fallback_name = f'0x{hop_hash.upper()}'
+
+        return RouteNode(
+            name=fallback_name,
+            pubkey=hop_hash,
+        )
 
-            if hop_contact:
-                nodes.append(RouteNode(
-                    name=hop_contact.get('adv_name') or f'0x{hop_hash}',
-                    lat=hop_contact.get('adv_lat', 0),
-                    lon=hop_contact.get('adv_lon', 0),
-                    type=hop_contact.get('type', 0),
-                    pubkey=hop_hash,
-                ))
-            else:
-                # Fallback: use the name that was stored at receive time
-                fallback_name = '-'
-                if stored_names and idx < len(stored_names):
-                    fallback_name = stored_names[idx] or '-'
-                if fallback_name == '-':
-                    fallback_name = f'0x{hop_hash.upper()}'
-
-                nodes.append(RouteNode(
-                    name=fallback_name,
-                    pubkey=hop_hash,
-                ))
-
-        return nodes
-
-    @staticmethod
     def _parse_out_path(
+        self,
         out_path: str,
         out_path_len: int,
-        contacts: Dict,
+        raw: Optional[bytes] = None,
     ) -> List[RouteNode]:
-        """Parse out_path hex string into a list of RouteNode objects."""
-        hashes: List[str] = []
-        hop_hex_len = 2
-
-        for i in range(0, min(len(out_path), out_path_len * 2), hop_hex_len):
-            hop_hash = out_path[i:i + hop_hex_len]
-            if hop_hash and len(hop_hash) == 2:
-                hashes.append(hop_hash)
-
-        return RouteBuilder._resolve_hashes(hashes, contacts)
-
-    @staticmethod
-    def _find_contact_by_pubkey_hash(
-        hash_hex: str, contacts: Dict,
-    ) -> Optional[Dict]:
-        hash_hex = hash_hex.lower()
-        for pubkey, contact in contacts.items():
-            if pubkey.lower().startswith(hash_hex):
-                return contact
-        return None
+        """Parse out_path hex string into a list of RouteNode objects.
+
+        *raw* is the pre-decoded form stored on the contact at refresh
+        time; when present the hex string is not touched at all.
+        """
+        if raw is not None:
+            raw = raw[:out_path_len]
+        else:
+            # One C-level hex decode instead of slicing 2 chars at a
+            # time; & ~1 drops a trailing odd nibble like the old loop
+            hex_len = min(len(out_path), out_path_len * 2) & ~1
+            try:
+                raw = bytes.fromhex(out_path[:hex_len])
+            except ValueError:
+                # Malformed hex from the device — fall back to per-hop
+                # slicing so valid leading hops still resolve
+                raw = b''
+                for i in range(0, hex_len, 2):
+                    try:
+                        raw += bytes.fromhex(out_path[i:i + 2])
+                    except ValueError:
+                        break
+
+        hashes = [_HEX[b] for b in raw]
+        return self._resolve_hashes(hashes)
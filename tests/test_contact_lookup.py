@@ -0,0 +1,136 @@
+"""
+Unit tests for SharedData contact lookups.
+
+Tests cover:
+- Pubkey prefix lookup (exact keys, prefixes, truncated stored keys,
+  case folding)
+- Name lookup strategies (exact, case-insensitive, duplicates,
+  mutual-prefix fallback)
+- Combined sender resolution (resolve_sender)
+- Index invalidation when contacts change
+"""
+
+import unittest
+
+from meshcore_gui.core.shared_data import SharedData
+
+
+class TestContactLookup(unittest.TestCase):
+    """Test cases for pubkey/name lookups on SharedData."""
+
+    def setUp(self):
+        self.shared = SharedData()
+        self.shared.set_contacts({
+            'aa11fullkey00': {'adv_name': 'Alpha'},
+            'bb22fullkey00': {'adv_name': 'Bravo'},
+            'cc33': {'adv_name': 'Charlie'},  # truncated stored key
+            'dd44dupkey000': {'adv_name': 'Dup'},
+            'ee55dupkey000': {'adv_name': 'Dup'},
+        })
+
+    # ------------------------------------------------------------------
+    # get_contact_by_prefix
+    # ------------------------------------------------------------------
+
+    def test_prefix_exact_key(self):
+        """A full pubkey matches its contact directly."""
+        contact = self.shared.get_contact_by_prefix('aa11fullkey00')
+        self.assertEqual(contact['adv_name'], 'Alpha')
+
+    def test_prefix_shorter_query(self):
+        """A query shorter than the stored key matches by prefix."""
+        contact = self.shared.get_contact_by_prefix('aa11')
+        self.assertEqual(contact['adv_name'], 'Alpha')
+
+    def test_prefix_case_folding(self):
+        """Lookups are case-insensitive on both sides."""
+        contact = self.shared.get_contact_by_prefix('AA11FULL')
+        self.assertEqual(contact['adv_name'], 'Alpha')
+
+    def test_prefix_truncated_stored_key(self):
+        """A stored key shorter than the query still matches."""
+        contact = self.shared.get_contact_by_prefix('cc33deadbeef')
+        self.assertEqual(contact['adv_name'], 'Charlie')
+
+    def test_prefix_miss(self):
+        self.assertIsNone(self.shared.get_contact_by_prefix('ff99'))
+        self.assertIsNone(self.shared.get_contact_by_prefix(''))
+
+    def test_prefix_returns_copy(self):
+        """Mutating a returned contact must not touch the store."""
+        contact = self.shared.get_contact_by_prefix('aa11')
+        contact['adv_name'] = 'Mutated'
+        self.assertEqual(
+            self.shared.get_contact_by_prefix('aa11')['adv_name'], 'Alpha',
+        )
+
+    # ------------------------------------------------------------------
+    # get_contact_by_name
+    # ------------------------------------------------------------------
+
+    def test_name_exact(self):
+        key, contact = self.shared.get_contact_by_name('Alpha')
+        self.assertEqual(key, 'aa11fullkey00')
+        self.assertEqual(contact['adv_name'], 'Alpha')
+
+    def test_name_case_insensitive(self):
+        key, _contact = self.shared.get_contact_by_name('bRaVo')
+        self.assertEqual(key, 'bb22fullkey00')
+
+    def test_name_duplicate_first_wins(self):
+        """On duplicate names the first contact in order is returned."""
+        key, _contact = self.shared.get_contact_by_name('Dup')
+        self.assertEqual(key, 'dd44dupkey000')
+
+    def test_name_prefix_fallback(self):
+        """A longer query falls back to the mutual-prefix scan."""
+        key, _contact = self.shared.get_contact_by_name('Alphastation')
+        self.assertEqual(key, 'aa11fullkey00')
+
+    def test_name_miss(self):
+        self.assertIsNone(self.shared.get_contact_by_name('Nobody'))
+        self.assertIsNone(self.shared.get_contact_by_name(''))
+
+    # ------------------------------------------------------------------
+    # resolve_sender
+    # ------------------------------------------------------------------
+
+    def test_resolve_sender_prefix_hit(self):
+        """A pubkey hit wins and reports the queried pubkey."""
+        pubkey, contact = self.shared.resolve_sender('aa11', 'Bravo')
+        self.assertEqual(pubkey, 'aa11')
+        self.assertEqual(contact['adv_name'], 'Alpha')
+
+    def test_resolve_sender_name_fallback(self):
+        """A pubkey miss falls back to the name and reports the stored key."""
+        pubkey, contact = self.shared.resolve_sender('ff99', 'Bravo')
+        self.assertEqual(pubkey, 'bb22fullkey00')
+        self.assertEqual(contact['adv_name'], 'Bravo')
+
+    def test_resolve_sender_miss(self):
+        self.assertIsNone(self.shared.resolve_sender('ff99', 'Nobody'))
+        self.assertIsNone(self.shared.resolve_sender('', ''))
+
+    # ------------------------------------------------------------------
+    # Index invalidation
+    # ------------------------------------------------------------------
+
+    def test_indexes_rebuilt_on_contacts_change(self):
+        """Lookups reflect a replaced contact set, not stale indexes."""
+        # Warm all lazy indexes
+        self.shared.get_contact_by_prefix('aa11')
+        self.shared.get_contact_by_name('Alpha')
+
+        self.shared.set_contacts({'9988newkey000': {'adv_name': 'Nova'}})
+
+        self.assertIsNone(self.shared.get_contact_by_prefix('aa11'))
+        self.assertIsNone(self.shared.get_contact_by_name('Alpha'))
+        self.assertEqual(
+            self.shared.get_contact_by_prefix('9988')['adv_name'], 'Nova',
+        )
+        key, _contact = self.shared.get_contact_by_name('Nova')
+        self.assertEqual(key, '9988newkey000')
+
+
+if __name__ == '__main__':
+    unittest.main()
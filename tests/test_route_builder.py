@@ -0,0 +1,177 @@
+"""
+Unit tests for RouteBuilder.
+
+Tests cover:
+- Sender resolution via pubkey prefix and name fallback
+- RX_LOG hash resolution with archived-name fallback
+- out_path parsing, hop clamping and malformed hex
+- Direct-message gating (path_len == 0)
+- Per-message memoization
+"""
+
+import unittest
+
+from meshcore_gui.core.models import Message
+from meshcore_gui.core.shared_data import SharedData
+from meshcore_gui.services.route_builder import RouteBuilder
+
+
+def _msg(**kwargs):
+    """Message with route-irrelevant fields defaulted."""
+    fields = dict(
+        time='12:00:00', sender='', text='hi', channel=0, direction='in',
+    )
+    fields.update(kwargs)
+    return Message(**fields)
+
+
+class TestRouteBuilder(unittest.TestCase):
+    """Test cases for RouteBuilder.build."""
+
+    def setUp(self):
+        self.shared = SharedData()
+        self.shared.set_contacts({
+            'aa11sender000': {
+                'adv_name': 'Sender', 'adv_lat': 52.0, 'adv_lon': 6.0,
+                'type': 1, 'out_path': 'b1c2d3', 'out_path_len': 3,
+            },
+            'b1repeater000': {
+                'adv_name': 'Rep1', 'adv_lat': 51.0, 'adv_lon': 5.0,
+                'type': 2,
+            },
+            'c2repeater000': {
+                'adv_name': 'Rep2', 'adv_lat': 0, 'adv_lon': 0, 'type': 2,
+            },
+        })
+        self.builder = RouteBuilder(self.shared)
+
+    def _data(self):
+        """Snapshot stub with the fields build() reads."""
+        return {
+            'name': 'Me',
+            'adv_lat': 52.5,
+            'adv_lon': 6.1,
+            'contacts_version': self.shared.contacts_version,
+            'device_version': 1,
+        }
+
+    # ------------------------------------------------------------------
+    # Sender resolution
+    # ------------------------------------------------------------------
+
+    def test_sender_resolved_by_pubkey_prefix(self):
+        msg = _msg(sender_pubkey='aa11', path_len=1)
+        route = self.builder.build(msg, self._data())
+        self.assertEqual(route['sender'].name, 'Sender')
+        self.assertEqual(route['sender'].pubkey, 'aa11')
+        self.assertEqual(route['sender'].lat, 52.0)
+
+    def test_sender_resolved_by_name_fallback(self):
+        msg = _msg(sender='Sender', sender_pubkey='ff99', path_len=1)
+        route = self.builder.build(msg, self._data())
+        self.assertEqual(route['sender'].name, 'Sender')
+        self.assertEqual(route['sender'].pubkey, 'aa11sender000')
+
+    def test_sender_unresolved(self):
+        msg = _msg(sender='Nobody', sender_pubkey='ff99')
+        route = self.builder.build(msg, self._data())
+        self.assertIsNone(route['sender'])
+
+    # ------------------------------------------------------------------
+    # Path resolution — RX_LOG hashes (priority 1)
+    # ------------------------------------------------------------------
+
+    def test_rx_log_hashes_take_priority(self):
+        """With path_hashes present, the contact's out_path is ignored."""
+        msg = _msg(
+            sender_pubkey='aa11', path_len=2, path_hashes=['b1', 'c2'],
+        )
+        route = self.builder.build(msg, self._data())
+        self.assertEqual(route['path_source'], 'rx_log')
+        self.assertEqual(
+            [n.name for n in route['path_nodes']], ['Rep1', 'Rep2'],
+        )
+        self.assertEqual(route['resolved_hops'], 2)
+
+    def test_rx_log_archived_name_fallback(self):
+        """Unknown hashes use the names stored at receive time."""
+        msg = _msg(
+            path_len=2, path_hashes=['b1', 'ee'],
+            path_names=['', 'StoredName'],
+        )
+        route = self.builder.build(msg, self._data())
+        self.assertEqual(
+            [n.name for n in route['path_nodes']], ['Rep1', 'StoredName'],
+        )
+
+    def test_rx_log_unknown_hash_placeholder(self):
+        """Without an archived name, the hash itself becomes the label."""
+        msg = _msg(path_len=1, path_hashes=['ee'])
+        route = self.builder.build(msg, self._data())
+        self.assertEqual(route['path_nodes'][0].name, '0xEE')
+
+    # ------------------------------------------------------------------
+    # Path resolution — contact out_path (priority 2)
+    # ------------------------------------------------------------------
+
+    def test_out_path_clamped_to_msg_path_len(self):
+        """Never resolve more hops than the message traversed."""
+        msg = _msg(sender_pubkey='aa11sender000', path_len=2)
+        route = self.builder.build(msg, self._data())
+        self.assertEqual(route['path_source'], 'contact_out_path')
+        self.assertEqual(
+            [n.name for n in route['path_nodes']], ['Rep1', 'Rep2'],
+        )
+
+    def test_direct_message_skips_out_path(self):
+        """path_len == 0 on an incoming message means no hops to show."""
+        msg = _msg(sender_pubkey='aa11sender000', path_len=0)
+        route = self.builder.build(msg, self._data())
+        self.assertEqual(route['path_source'], 'none')
+        self.assertEqual(route['path_nodes'], [])
+
+    def test_outgoing_uses_full_out_path(self):
+        """Outgoing messages carry no hop count; show the stored route."""
+        msg = _msg(sender_pubkey='aa11sender000', direction='out')
+        route = self.builder.build(msg, self._data())
+        self.assertEqual(route['path_source'], 'contact_out_path')
+        self.assertEqual(route['resolved_hops'], 3)
+
+    def test_malformed_out_path_hex(self):
+        """Bad hex from the device still resolves the valid leading hops."""
+        self.shared.set_contacts({
+            'aa11sender000': {
+                'adv_name': 'Sender',
+                'out_path': 'b1zz', 'out_path_len': 2,
+            },
+            'b1repeater000': {'adv_name': 'Rep1'},
+        })
+        msg = _msg(sender_pubkey='aa11sender000', path_len=2)
+        route = self.builder.build(msg, self._data())
+        self.assertEqual([n.name for n in route['path_nodes']], ['Rep1'])
+
+    # ------------------------------------------------------------------
+    # Memoization
+    # ------------------------------------------------------------------
+
+    def test_memoized_for_identical_inputs(self):
+        """The same message against the same versions reuses the result."""
+        data = self._data()
+        first = self.builder.build(_msg(sender_pubkey='aa11', path_len=1), data)
+        second = self.builder.build(_msg(sender_pubkey='aa11', path_len=1), data)
+        self.assertIs(first, second)
+
+    def test_memo_invalidated_on_contacts_change(self):
+        """A contacts change produces a freshly resolved route."""
+        msg = _msg(sender_pubkey='aa11', path_len=1)
+        first = self.builder.build(msg, self._data())
+        self.assertEqual(first['sender'].name, 'Sender')
+
+        self.shared.set_contacts({'aa11sender000': {'adv_name': 'Renamed'}})
+        second = self.builder.build(msg, self._data())
+        self.assertIsNot(first, second)
+        self.assertEqual(second['sender'].name, 'Renamed')
+
+
+if __name__ == '__main__':
+    unittest.main()